@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+"""
+In-process response cache for LLM wrappers in HooRAGLib.
+This module defines an LRU cache that can also match near-identical prompts by embedding similarity.
+
+:author: Hoo-dkwozD
+:version: 1.0.0
+:date: 2025-07-14
+"""
+
+# Python Standard Library imports
+from collections import OrderedDict
+import copy
+from hashlib import blake2b
+import json
+from typing import Any, Optional
+
+# Third-party imports
+import numpy as np
+
+# Local imports
+
+
+class ResponseCache:
+    """
+    LRU cache of wrapper responses keyed by a hash of the request.
+    When a similarity threshold is set, entries stored with a prompt embedding can also be
+    matched by cosine similarity against entries that share the same scope.
+    """
+
+    def __init__(self, capacity: int = 1024, threshold: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        :param capacity: The maximum number of cached responses. A capacity of 0 disables the cache.
+        :param threshold: The minimum cosine similarity for a semantic match, or None to only match exact keys.
+
+        :raises ValueError: If the capacity is negative.
+        """
+
+        if capacity < 0:
+            raise ValueError("Cache capacity must not be negative.")
+
+        self.capacity = capacity
+        self.threshold = threshold
+
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+        # Normalized prompt embeddings, one row per semantically cached entry
+        self._matrix: Optional[np.ndarray] = None
+        self._rows: dict[str, int] = {}
+        self._row_keys: list[Optional[str]] = [None] * capacity
+        self._row_scopes: list[Optional[str]] = [None] * capacity
+        self._free_rows = list(range(capacity - 1, -1, -1))
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Hash the given request parts into a cache key.
+
+        :param parts: JSON-serializable parts of the request.
+        :return: The hex digest of the request parts.
+        """
+
+        return blake2b(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a response by its exact key.
+
+        :param key: The cache key of the request.
+        :return: A deep copy of the cached response, or None if not cached.
+        """
+
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+
+        # Callers may update the response they receive, which must not change the cached entry
+        return copy.deepcopy(response)
+
+    def get_similar(self, scope: str, embedding: np.ndarray) -> Optional[Any]:
+        """
+        Look up the most similar cached response within a scope.
+
+        :param scope: The scope the cached entry must share, e.g. a hash of the model and system prompt.
+        :param embedding: The embedding of the prompt.
+        :return: The cached response, or None if no entry is similar enough.
+        """
+
+        if self.threshold is None or self._matrix is None or not self._rows:
+            return None
+
+        scores = self._matrix @ self._normalize(embedding)
+
+        # Unused rows are zeroed, so they never pass a positive threshold
+        candidates = np.flatnonzero(scores >= self.threshold)
+        for row in candidates[np.argsort(-scores[candidates])]:
+            if self._row_scopes[row] == scope:
+                return self.get(self._row_keys[row])
+
+        return None
+
+    def put(
+        self,
+        key: str,
+        response: Any,
+        scope: Optional[str] = None,
+        embedding: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Store a response, evicting the least recently used entry when full.
+
+        :param key: The cache key of the request.
+        :param response: The response to cache, stored as a deep copy.
+        :param scope: The scope of the entry, required for semantic matching.
+        :param embedding: The embedding of the prompt, required for semantic matching.
+        """
+
+        if self.capacity == 0:
+            return
+
+        response = copy.deepcopy(response)
+
+        if key in self._entries:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            return
+
+        if len(self._entries) >= self.capacity:
+            evicted, _ = self._entries.popitem(last=False)
+            self._release_row(evicted)
+
+        self._entries[key] = response
+
+        if self.threshold is not None and scope is not None and embedding is not None:
+            if self._matrix is None:
+                self._matrix = np.zeros((self.capacity, len(embedding)), dtype=np.float32)
+
+            row = self._free_rows.pop()
+            self._matrix[row] = self._normalize(embedding)
+            self._rows[key] = row
+            self._row_keys[row] = key
+            self._row_scopes[row] = scope
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+
+        for key in list(self._rows):
+            self._release_row(key)
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _release_row(self, key: str) -> None:
+        """
+        Free the embedding row of an entry, if it has one.
+
+        :param key: The cache key of the entry.
+        """
+
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+
+        self._matrix[row] = 0
+        self._row_keys[row] = None
+        self._row_scopes[row] = None
+        self._free_rows.append(row)
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize an embedding.
+
+        :param embedding: The embedding to normalize.
+        :return: The normalized embedding as float32.
+        """
+
+        embedding = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+
+        return embedding / norm if norm else embedding
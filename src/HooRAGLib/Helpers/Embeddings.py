@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+"""
+Embedding helpers for HooRAGLib.
+This module converts OpenAI embedding responses into NumPy matrices.
+
+:author: Hoo-dkwozD
+:version: 1.0.0
+:date: 2025-07-14
+"""
+
+# Python Standard Library imports
+import base64
+from typing import Any, Sequence
+
+# Third-party imports
+import numpy as np
+
+# Local imports
+
+
+# Maximum number of inputs the OpenAI embeddings endpoint accepts per request
+MAX_EMBEDDING_BATCH_SIZE = 2048
+
+
+def decode_embeddings(data: Sequence[Any]) -> np.ndarray:
+    """
+    Decode the items of an embeddings response into a float32 matrix.
+    Items requested with `encoding_format="base64"` are copied straight from their raw bytes,
+    float lists returned by backends that ignore the encoding format are converted as is.
+
+    :param data: The `data` items of an embeddings response.
+    :return: A matrix with one row per item, ordered by item index.
+    """
+
+    if not data:
+        return np.empty((0, 0), dtype=np.float32)
+
+    out = None
+    for item in data:
+        if isinstance(item.embedding, str):
+            row = np.frombuffer(base64.b64decode(item.embedding), dtype=np.float32)
+        else:
+            row = np.asarray(item.embedding, dtype=np.float32)
+
+        if out is None:
+            out = np.empty((len(data), len(row)), dtype=np.float32)
+        out[item.index] = row
+
+    return out
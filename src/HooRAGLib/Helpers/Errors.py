@@ -20,3 +20,9 @@ class EmbeddingError(Exception):
     """Base class for all embedding-related errors."""
 
     pass
+
+
+class GenerationError(Exception):
+    """Base class for all generation-related errors."""
+
+    pass
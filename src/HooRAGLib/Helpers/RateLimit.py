@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+"""
+Client-side rate limiting for LLM wrappers in HooRAGLib.
+This module defines a token bucket that keeps callers under request and token per-minute limits.
+
+:author: Hoo-dkwozD
+:version: 1.0.0
+:date: 2025-07-14
+"""
+
+# Python Standard Library imports
+import asyncio
+import threading
+import time
+
+# Third-party imports
+
+# Local imports
+
+
+class TokenBucket:
+    """
+    Token bucket limiting both requests per minute and tokens per minute.
+    Both buckets start full and refill continuously. Acquiring reserves capacity immediately and
+    waits until the reservation is covered, so concurrent callers are served in arrival order.
+    """
+
+    def __init__(self, rpm: int = 3500, tpm: int = 90000):
+        """
+        Initialize the bucket with per-minute limits.
+
+        :param rpm: The maximum number of requests per minute.
+        :param tpm: The maximum number of tokens per minute.
+
+        :raises ValueError: If a limit is not positive.
+        """
+
+        if rpm <= 0 or tpm <= 0:
+            raise ValueError("Rate limits must be positive.")
+
+        self.rpm = rpm
+        self.tpm = tpm
+
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        Block until a request using the given number of tokens is allowed.
+
+        :param tokens: The estimated number of tokens of the request.
+        """
+
+        time.sleep(self._reserve(tokens))
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """
+        Wait until a request using the given number of tokens is allowed.
+
+        :param tokens: The estimated number of tokens of the request.
+        """
+
+        await asyncio.sleep(self._reserve(tokens))
+
+    def _reserve(self, tokens: int) -> float:
+        """
+        Reserve capacity for a request.
+
+        :param tokens: The estimated number of tokens of the request.
+        :return: The number of seconds until the reservation is covered.
+        """
+
+        # A request larger than the limit could never be covered
+        tokens = min(tokens, self.tpm)
+
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+            self._requests -= 1
+            self._tokens -= tokens
+
+            return max(0.0, -self._requests * 60 / self.rpm, -self._tokens * 60 / self.tpm)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+"""
+Streaming helpers for LLM wrappers in HooRAGLib.
+This module defines a buffer that groups streamed text deltas into progressively larger batches.
+
+:author: Hoo-dkwozD
+:version: 1.0.0
+:date: 2025-07-14
+"""
+
+# Python Standard Library imports
+import math
+from typing import Optional
+
+# Third-party imports
+
+# Local imports
+
+
+class StreamBuffer:
+    """
+    Buffer for streamed text deltas.
+    The first batch is flushed as soon as it reaches `min_batch_size` characters to keep the time to
+    first output low, after which the batch size grows by `growth_factor` up to `max_batch_size`.
+    """
+
+    def __init__(
+        self,
+        min_batch_size: int = 1,
+        growth_factor: float = 2.0,
+        max_batch_size: int = 64
+    ):
+        """
+        Initialize the buffer.
+
+        :param min_batch_size: The number of characters in the first batch.
+        :param growth_factor: The factor the batch size grows by after each flush.
+        :param max_batch_size: The maximum number of characters buffered before a flush.
+
+        :raises ValueError: If the batch sizes or growth factor are invalid.
+        """
+
+        if min_batch_size < 1 or max_batch_size < min_batch_size:
+            raise ValueError("Batch sizes must satisfy 1 <= min_batch_size <= max_batch_size.")
+        if growth_factor < 1:
+            raise ValueError("Growth factor must be at least 1.")
+
+        self.growth_factor = growth_factor
+        self.max_batch_size = max_batch_size
+
+        self._batch_size = min_batch_size
+        self._parts: list[str] = []
+        self._length = 0
+
+    def add(self, delta: str) -> Optional[str]:
+        """
+        Add a delta to the buffer.
+
+        :param delta: The streamed text delta.
+        :return: The buffered text if the batch is full, otherwise None.
+        """
+
+        self._parts.append(delta)
+        self._length += len(delta)
+
+        if self._length < self._batch_size:
+            return None
+
+        self._batch_size = min(math.ceil(self._batch_size * self.growth_factor), self.max_batch_size)
+
+        return self.flush()
+
+    def flush(self) -> str:
+        """
+        Empty the buffer.
+
+        :return: The buffered text.
+        """
+
+        text = "".join(self._parts)
+        self._parts = []
+        self._length = 0
+
+        return text
@@ -10,17 +10,106 @@ This class extends BaseModel and provides methods to interact with OpenAI's API.
 """
 
 # Python Standard Library imports
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import math
 import os
-from typing import Any, Optional
+import time
+import warnings
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
 
 # Third-party imports
-from openai import OpenAI, AuthenticationError, APIError, RateLimitError
+import httpx
+import msgspec
+import numpy as np
+from openai import OpenAI, AsyncOpenAI, AuthenticationError, APIError, RateLimitError
+from openai import APIConnectionError, BadRequestError, InternalServerError, DefaultHttpxClient
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
 # Local imports
-from HooRAGLib.Helpers.Errors import EmbeddingError
+from HooRAGLib.Helpers.Cache import ResponseCache
+from HooRAGLib.Helpers.Embeddings import MAX_EMBEDDING_BATCH_SIZE, decode_embeddings
+from HooRAGLib.Helpers.Errors import EmbeddingError, GenerationError
+from HooRAGLib.Helpers.RateLimit import TokenBucket
+from HooRAGLib.Helpers.Streaming import StreamBuffer
 from HooRAGLib.Models.BaseLLM import BaseLLM
 from HooRAGLib.Models.BaseLLM import WrapperResponse
-from HooRAGLib.Retrievers.BaseRetriever import BaseRetriever
+from HooRAGLib.Retrievers.BaseRetriever import BaseRetriever, format_context
+
+
+# Model version prefixes served by the legacy completions endpoint
+COMPLETION_MODEL_PREFIXES = ("gpt-3.5-turbo-instruct", "davinci-002", "babbage-002")
+
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant."
+
+# Transient API errors that are retried with exponential backoff
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+class Usage(msgspec.Struct):
+    """Token usage of a chat completion."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+
+class Message(msgspec.Struct):
+    """Message of a chat completion choice."""
+
+    content: Optional[str] = None
+
+
+class Choice(msgspec.Struct):
+    """Choice of a chat completion."""
+
+    message: Message
+    index: int = 0
+
+
+class ChatResponse(msgspec.Struct):
+    """Fields of a chat completion used by the wrapper, other fields are skipped while decoding."""
+
+    choices: list[Choice]
+    usage: Optional[Usage] = None
+
+
+# Decodes raw chat completion bodies without building the SDK's Pydantic models
+_CHAT_RESPONSE_DECODER = msgspec.json.Decoder(ChatResponse)
+
+# Sync clients per API key and client options, shared across instances to reuse pooled connections
+_CLIENT_REGISTRY: dict[tuple, OpenAI] = {}
+
+# Available models per API key hash and base URL, shared across instances
+_MODELS_CACHE: dict[tuple[str, str], Any] = {}
+
+
+def _get_client(api_key: str, kwargs: dict[str, Any]) -> OpenAI:
+    """
+    Get the shared OpenAI client for an API key and client options, creating it if needed.
+    New clients use a pooled HTTP/2 connection unless a custom `http_client` is given.
+
+    :param api_key: The OpenAI API key.
+    :param kwargs: Additional parameters for the OpenAI client.
+    :return: The OpenAI client.
+    """
+
+    key = (api_key, tuple(sorted(kwargs.items())))
+    try:
+        client = _CLIENT_REGISTRY.get(key)
+    except TypeError:
+        # Options with unhashable values, such as header dicts, get their own client
+        return OpenAI(api_key=api_key, **kwargs)
+
+    if client is None:
+        http_client = kwargs.get('http_client') or DefaultHttpxClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            http2=True
+        )
+        client = _CLIENT_REGISTRY[key] = OpenAI(api_key=api_key, **{**kwargs, 'http_client': http_client})
+
+    return client
 
 
 class OpenAILLM(BaseLLM):
@@ -39,29 +128,64 @@ class OpenAILLM(BaseLLM):
         
         :param model_name: The name of the OpenAI model to use.
         :param kwargs: Additional parameters for the OpenAI API.
+            An `httpx.AsyncClient` passed as `http_client` is only used by the async client,
+            any other `http_client` is only used by the sync client.
+            `cache_size` sets the number of responses cached by `generate` (default 1024, 0 disables it),
+            `semantic_cache` also matches prompts by embedding similarity above `cache_threshold` (default 0.97).
+            `rpm` and `tpm` set the client-side request and token limits per minute (default 3500 and 90000).
+            `embedding_model` sets the model used by `embed_texts` and the semantic cache (default text-embedding-3-small).
+            `prompt_cache_key` sends a prompt cache key with each chat request (default True). Backends that
+            reject the key are detected on the first rejected request, after which the key is no longer sent.
+            `max_retries` defaults to 0, since transient errors are already retried with backoff by the wrapper
+            and the SDK's own retries would multiply the attempts of every request.
 
         :raises ValueError: If the api key is not provided.
-        :raises AuthenticationError: If the provided API key is invalid.
         """
 
-        API_KEY = os.environ.get('OPENAI_API_KEY') if 'api_key' not in kwargs else kwargs.get('api_key')
+        API_KEY = os.environ.get('OPENAI_API_KEY') if 'api_key' not in kwargs else kwargs.pop('api_key')
 
         if not API_KEY:
             raise ValueError("OPENAI_API_KEY environment variable is not set.")
 
-        try:
-            client = OpenAI(api_key=API_KEY, **kwargs)
-            models = client.models.list()
-        except AuthenticationError as e:
-            raise ValueError("Invalid OpenAI API key provided.") from e
+        cache_size = kwargs.pop('cache_size', 1024)
+        semantic_cache = kwargs.pop('semantic_cache', False)
+        cache_threshold = kwargs.pop('cache_threshold', 0.97)
+        embedding_model = kwargs.pop('embedding_model', "text-embedding-3-small")
+        rpm = kwargs.pop('rpm', 3500)
+        tpm = kwargs.pop('tpm', 90000)
+        prompt_cache_key = kwargs.pop('prompt_cache_key', True)
 
-        self.client = client
-        self.models = models
+        # Requests are retried by _create_completion, so the SDK does not retry them again
+        kwargs.setdefault('max_retries', 0)
+
+        # Route a custom HTTP client to the OpenAI client that can use it
+        http_client = kwargs.pop('http_client', None)
+        if isinstance(http_client, httpx.AsyncClient):
+            sync_kwargs, async_kwargs = kwargs, {**kwargs, 'http_client': http_client}
+        elif http_client is not None:
+            sync_kwargs, async_kwargs = {**kwargs, 'http_client': http_client}, kwargs
+        else:
+            sync_kwargs, async_kwargs = kwargs, kwargs
+
+        self.client = _get_client(API_KEY, sync_kwargs)
+        # Async connection pools are bound to an event loop, so async clients are not shared
+        self.aclient = AsyncOpenAI(api_key=API_KEY, **async_kwargs)
+
+        # Available models are only listed when first needed
+        self.models = None
+        self._model_ids = frozenset()
+        # The same key, such as a placeholder, can be used with several OpenAI-compatible servers
+        self._models_key = (hashlib.sha256(API_KEY.encode()).hexdigest(), str(self.client.base_url))
         self.model_name = model_name
 
         self.model_version = None
         self.system_prompt = None
         self.retriever = None
+        self.embedding_model = embedding_model
+
+        self._cache = ResponseCache(cache_size, cache_threshold if semantic_cache else None)
+        self._bucket = TokenBucket(rpm=rpm, tpm=tpm)
+        self._prompt_cache_key = prompt_cache_key
 
     def configure(
         self, 
@@ -77,7 +201,7 @@ class OpenAILLM(BaseLLM):
 
         :return: A dictionary containing the configuration response.
 
-        :raises ValueError: If the model version is not specified or invalid.
+        :raises ValueError: If the model version is not specified or invalid, or if the API key is invalid.
         :raises TypeError: If the retriever is not an instance of BaseRetriever.
         """
 
@@ -87,8 +211,18 @@ class OpenAILLM(BaseLLM):
         # Check for valid model version
         if not model_version:
             raise ValueError("Model version must be specified.")
+        # List the available models once per API key and server
+        if self.models is None:
+            if self._models_key not in _MODELS_CACHE:
+                try:
+                    _MODELS_CACHE[self._models_key] = self._create_completion(self.client.models.list)
+                except AuthenticationError as e:
+                    raise ValueError("Invalid OpenAI API key provided.") from e
+
+            self.models = _MODELS_CACHE[self._models_key]
+            self._model_ids = frozenset(model.id for model in self.models.data)
         # Check if model_version is a valid OpenAI model
-        if model_version not in [model.id for model in self.models.data]:
+        if model_version not in self._model_ids:
             raise ValueError(f"Model version '{model_version}' is not available as an OpenAI models.")
         self.model_version = model_version
 
@@ -108,7 +242,8 @@ class OpenAILLM(BaseLLM):
     def embed(self) -> WrapperResponse:
         """
         Generate embeddings for the provided input using the specified Retriever.
-        Only available if the Retriever is set up.
+        Only available if the Retriever is set up. Retrievers that set `embeds_with_wrapper` receive
+        this wrapper, whose `embed_texts` and `aembed_texts` batch, rate limit and retry requests.
 
         :return: A dictionary containing the generated embeddings and model information.
 
@@ -124,7 +259,7 @@ class OpenAILLM(BaseLLM):
 
         # Use the retriever to generate embeddings
         try:
-            response = self.retriever.embed(client=self.client)
+            response = self.retriever.embed(client=self if self.retriever.embeds_with_wrapper else self.client)
 
             return {
                 "status": True,
@@ -132,11 +267,155 @@ class OpenAILLM(BaseLLM):
                 "embeddings": response['data'],
                 "model": self.model_name
             }
+        except APIError:
+            # Let authentication and retryable API errors reach the caller unchanged
+            raise
         except Exception as e:
             raise EmbeddingError(f"Failed to generate embeddings: {str(e)}")
 
-    def generate(
+    async def aembed(self) -> WrapperResponse:
+        """
+        Asynchronously generate embeddings for the provided input using the specified Retriever.
+        Only available if the Retriever is set up. Retrievers that set `embeds_with_wrapper` receive
+        this wrapper, whose `embed_texts` and `aembed_texts` batch, rate limit and retry requests.
+
+        :return: A dictionary containing the generated embeddings and model information.
+
+        :raises ValueError: If the retriever is not set or if the client is not initialized.
+        :raises EmbeddingError: If there is an error during the embedding process.
+        """
+
+        # Check if model is instantiated
+        self._check_client()
+
+        # Check if retriever is set
+        self._check_retriever()
+
+        # Use the retriever to generate embeddings with the async client
+        try:
+            response = await self.retriever.aembed(client=self if self.retriever.embeds_with_wrapper else self.aclient)
+
+            return {
+                "status": True,
+                "message": "Embeddings generated successfully.",
+                "embeddings": response['data'],
+                "model": self.model_name
+            }
+        except APIError:
+            # Let authentication and retryable API errors reach the caller unchanged
+            raise
+        except Exception as e:
+            raise EmbeddingError(f"Failed to generate embeddings: {str(e)}")
+
+    def embed_texts(
         self,
+        texts: list[str],
+        batch_size: int = 512,
+        model: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Generate embeddings for the given texts, sending them in batches.
+
+        :param texts: The texts to embed.
+        :param batch_size: The number of texts per request, at most 2048.
+        :param model: The embedding model to use, defaults to the wrapper's `embedding_model`.
+        :return: A float32 matrix with one row per text.
+
+        :raises ValueError: If the client is not initialized or if the batch size is invalid.
+        """
+
+        # Check if model is instantiated
+        self._check_client()
+
+        batches = self._embedding_batches(texts, batch_size)
+
+        return self._stack_embeddings([
+            decode_embeddings(self._create_completion(
+                self.client.embeddings.create,
+                model=model or self.embedding_model,
+                input=batch,
+                encoding_format="base64"
+            ).data)
+            for batch in batches
+        ])
+
+    async def aembed_texts(
+        self,
+        texts: list[str],
+        batch_size: int = 512,
+        concurrency: int = 8,
+        model: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Asynchronously generate embeddings for the given texts, sending batches concurrently.
+
+        :param texts: The texts to embed.
+        :param batch_size: The number of texts per request, at most 2048.
+        :param concurrency: The maximum number of requests in flight at once.
+        :param model: The embedding model to use, defaults to the wrapper's `embedding_model`.
+        :return: A float32 matrix with one row per text.
+
+        :raises ValueError: If the client is not initialized, the batch size is invalid or concurrency is not positive.
+        """
+
+        # Check if model is instantiated
+        self._check_client()
+
+        if concurrency < 1:
+            raise ValueError("Concurrency must be a positive integer.")
+
+        batches = self._embedding_batches(texts, batch_size)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _embed(batch: list[str]) -> np.ndarray:
+            async with semaphore:
+                response = await self._acreate_completion(
+                    self.aclient.embeddings.create,
+                    model=model or self.embedding_model,
+                    input=batch,
+                    encoding_format="base64"
+                )
+
+                return decode_embeddings(response.data)
+
+        return self._stack_embeddings(list(await asyncio.gather(*(_embed(batch) for batch in batches))))
+
+    def precompute_kv(self, chunks: list[str]) -> WrapperResponse:
+        """
+        Warm up the server-side prompt cache for the given chunks using the specified Retriever.
+        Later RAG requests that retrieve a warmed up chunk first reuse its cached prefill.
+
+        :param chunks: The chunks to warm up.
+        :return: A dictionary containing the prompt cache key of each chunk.
+
+        :raises ValueError: If the model is not configured, the retriever is not set or the client is not initialized.
+        """
+
+        # Check if model is instantiated
+        self._check_client()
+
+        # Check if model version is configured before sending any request
+        self._check_model_version()
+
+        # Check if retriever is set
+        self._check_retriever()
+
+        keys = self.retriever.precompute_kv(
+            warmup=self._warmup,
+            model_version=self.model_version,
+            system_prompt=self.system_prompt or DEFAULT_SYSTEM_PROMPT,
+            chunks=chunks
+        )
+
+        return {
+            "status": True,
+            "message": "Prompt cache warmed up successfully.",
+            "cache_keys": keys,
+            "model": self.model_name
+        }
+
+    def generate(
+        self, 
         user_prompt: str,
         is_rag: bool = True,
         max_tokens: int = 1000,
@@ -144,8 +423,65 @@ class OpenAILLM(BaseLLM):
     ) -> WrapperResponse:
         """
         Generate a response from the OpenAI model based on the provided prompt.
+        Repeated requests are answered from the response cache.
         
-        :param system_prompt: The system prompt to set the context for the model.
+        :param system_prompt: Deprecated and ignored, set the system prompt with configure() instead.
+        :param user_prompt: The user prompt to generate a response for.
+        :param max_tokens: The maximum number of tokens to generate.
+        :param kwargs: Additional parameters for the OpenAI API.
+        :return: A dictionary containing the generated response.
+
+        :raises ValueError: If the model is not initialized or if the retriever is not set.
+        :raises EmbeddingError: If there is an error during the generation process.
+        """
+
+        # Discard a per-call system prompt, warning the caller
+        self._pop_system_prompt(kwargs)
+
+        messages = self._build_messages(user_prompt, is_rag, kwargs)
+
+        # Return a cached response for the same or a similar enough request
+        cache_key = ResponseCache.make_key(self.model_version, messages, max_tokens, kwargs)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        scope, embedding = None, None
+        if self._cache.threshold is not None:
+            scope = ResponseCache.make_key(self.model_version, messages[0], max_tokens, kwargs)
+            embedding = self.embed_texts([user_prompt])[0]
+
+            cached = self._cache.get_similar(scope, embedding)
+            if cached is not None:
+                return cached
+
+        # Generate response using OpenAI's chat completions
+        raw = self._create_completion(
+            self.client.with_raw_response.chat.completions.create,
+            model=self.model_version,
+            messages=messages,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+        response = _CHAT_RESPONSE_DECODER.decode(raw.content)
+
+        wrapped = self._wrap_response(response)
+        self._cache.put(cache_key, wrapped, scope=scope, embedding=embedding)
+
+        return wrapped
+
+    async def agenerate(
+        self, 
+        user_prompt: str,
+        is_rag: bool = True,
+        max_tokens: int = 1000,
+        **kwargs: Any
+    ) -> WrapperResponse:
+        """
+        Asynchronously generate a response from the OpenAI model based on the provided prompt.
+        For RAG, generation starts speculatively with the first results of the retriever and is only
+        restarted if the final results differ, hiding the retrieval latency in the common case.
+
         :param user_prompt: The user prompt to generate a response for.
         :param max_tokens: The maximum number of tokens to generate.
         :param kwargs: Additional parameters for the OpenAI API.
@@ -155,53 +491,722 @@ class OpenAILLM(BaseLLM):
         :raises EmbeddingError: If there is an error during the generation process.
         """
 
+        # Discard a per-call system prompt, warning the caller
+        self._pop_system_prompt(kwargs)
+
+        if not is_rag:
+            response = await self._acomplete(user_prompt, False, None, max_tokens, kwargs)
+
+            return self._wrap_response(response)
+
+        # Ensure retriever is set and has embeddings generated for RAG
+        self._check_embeddings()
+
+        refinements = self.retriever.aretrieve(user_prompt)
+        chunks = self._as_chunks(await anext(refinements, []))
+
+        async def _collect_final() -> list[str]:
+            final = chunks
+            async for refinement in refinements:
+                final = self._as_chunks(refinement)
+
+            return final
+
+        # Overlap the rest of the retrieval with generation on the first results
+        retrieval = asyncio.create_task(_collect_final())
+        speculative = asyncio.create_task(self._acomplete(user_prompt, True, chunks, max_tokens, kwargs))
+
+        try:
+            final_chunks = await retrieval
+        except BaseException:
+            speculative.cancel()
+            raise
+
+        if final_chunks == chunks:
+            response = await speculative
+        else:
+            speculative.cancel()
+            response = await self._acomplete(user_prompt, True, final_chunks, max_tokens, kwargs)
+
+        return self._wrap_response(response)
+
+    async def agenerate_many(
+        self, 
+        user_prompts: list[str],
+        is_rag: bool = True,
+        max_tokens: int = 1000,
+        concurrency: int = 32,
+        **kwargs: Any
+    ) -> list[WrapperResponse]:
+        """
+        Generate responses for multiple prompts concurrently.
+        For high concurrency, construct the wrapper with an `httpx.AsyncClient` as `http_client`
+        whose connection limits match `concurrency`.
+
+        :param user_prompts: The user prompts to generate responses for.
+        :param max_tokens: The maximum number of tokens to generate per prompt.
+        :param concurrency: The maximum number of requests in flight at once.
+        :param kwargs: Additional parameters for the OpenAI API.
+        :return: A list of response dictionaries, in the same order as the prompts.
+
+        :raises ValueError: If the model is not initialized, the retriever is not set or concurrency is not positive.
+        :raises EmbeddingError: If there is an error during the generation process.
+        """
+
+        if concurrency < 1:
+            raise ValueError("Concurrency must be a positive integer.")
+
+        # Discard a per-call system prompt, warning the caller
+        self._pop_system_prompt(kwargs)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _generate(user_prompt: str) -> WrapperResponse:
+            async with semaphore:
+                return await self.agenerate(user_prompt, is_rag=is_rag, max_tokens=max_tokens, **kwargs)
+
+        return list(await asyncio.gather(*(_generate(user_prompt) for user_prompt in user_prompts)))
+
+    def stream_generate(
+        self,
+        user_prompt: str,
+        is_rag: bool = True,
+        max_tokens: int = 1000,
+        min_batch_size: int = 1,
+        growth_factor: float = 2.0,
+        max_batch_size: int = 64,
+        **kwargs: Any
+    ) -> Iterator[str]:
+        """
+        Stream a response from the OpenAI model as it is generated.
+        Deltas are grouped into batches that grow from `min_batch_size` to `max_batch_size` characters.
+
+        :param user_prompt: The user prompt to generate a response for.
+        :param is_rag: Whether to include the retrieved context.
+        :param max_tokens: The maximum number of tokens to generate.
+        :param min_batch_size: The number of characters in the first yielded batch.
+        :param growth_factor: The factor the batch size grows by after each yield.
+        :param max_batch_size: The maximum number of characters buffered before a yield.
+        :param kwargs: Additional parameters for the OpenAI API.
+        :return: An iterator over the generated text.
+
+        :raises ValueError: If the model is not initialized or if the retriever is not set.
+        :raises EmbeddingError: If the retriever does not have embeddings generated.
+        """
+
+        # Discard a per-call system prompt, warning the caller
+        self._pop_system_prompt(kwargs)
+
+        messages = self._build_messages(user_prompt, is_rag, kwargs)
+        buffer = StreamBuffer(min_batch_size, growth_factor, max_batch_size)
+
+        response = self._create_completion(
+            self.client.chat.completions.create,
+            model=self.model_version,
+            messages=messages,
+            max_tokens=max_tokens,
+            stream=True,
+            **kwargs
+        )
+
+        for chunk in response:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                text = buffer.add(delta)
+                if text:
+                    yield text
+
+        text = buffer.flush()
+        if text:
+            yield text
+
+    async def astream_generate(
+        self,
+        user_prompt: str,
+        is_rag: bool = True,
+        max_tokens: int = 1000,
+        min_batch_size: int = 1,
+        growth_factor: float = 2.0,
+        max_batch_size: int = 64,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously stream a response from the OpenAI model as it is generated.
+        Deltas are grouped into batches that grow from `min_batch_size` to `max_batch_size` characters.
+
+        :param user_prompt: The user prompt to generate a response for.
+        :param is_rag: Whether to include the retrieved context.
+        :param max_tokens: The maximum number of tokens to generate.
+        :param min_batch_size: The number of characters in the first yielded batch.
+        :param growth_factor: The factor the batch size grows by after each yield.
+        :param max_batch_size: The maximum number of characters buffered before a yield.
+        :param kwargs: Additional parameters for the OpenAI API.
+        :return: An async iterator over the generated text.
+
+        :raises ValueError: If the model is not initialized or if the retriever is not set.
+        :raises EmbeddingError: If the retriever does not have embeddings generated.
+        """
+
+        # Discard a per-call system prompt, warning the caller
+        self._pop_system_prompt(kwargs)
+
+        # Retrieve without blocking the event loop
+        chunks = await self._aretrieve_chunks(user_prompt) if is_rag else None
+        messages = self._build_messages(user_prompt, is_rag, kwargs, chunks=chunks)
+        buffer = StreamBuffer(min_batch_size, growth_factor, max_batch_size)
+
+        response = await self._acreate_completion(
+            self.aclient.chat.completions.create,
+            model=self.model_version,
+            messages=messages,
+            max_tokens=max_tokens,
+            stream=True,
+            **kwargs
+        )
+
+        async for chunk in response:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                text = buffer.add(delta)
+                if text:
+                    yield text
+
+        text = buffer.flush()
+        if text:
+            yield text
+
+    def generate_multi(
+        self,
+        user_prompts: list[str],
+        is_rag: bool = False,
+        max_tokens: int = 1000,
+        concurrency: int = 32,
+        **kwargs: Any
+    ) -> WrapperResponse:
+        """
+        Generate responses for multiple prompts with as few requests as possible.
+        Completion models receive all prompts in a single request. Chat models do not accept
+        multiple prompts per request, so their prompts are sent concurrently from a thread pool instead.
+
+        :param user_prompts: The user prompts to generate responses for.
+        :param is_rag: Whether to include the retrieved context.
+        :param max_tokens: The maximum number of tokens to generate per prompt.
+        :param concurrency: The maximum number of chat requests in flight at once.
+        :param kwargs: Additional parameters for the OpenAI API.
+        :return: A dictionary containing the generated choices for each prompt, in the same order as the prompts,
+            and the token usage summed over all requests under "usage", None if the backend did not report it.
+
+        :raises ValueError: If the model is not initialized or configured, the retriever is not set or concurrency is not positive.
+        :raises EmbeddingError: If the retriever does not have embeddings generated.
+        """
+
         # Check if model is instantiated
         self._check_client()
 
+        # Check if model version is configured, it decides which endpoint is used
+        self._check_model_version()
+
+        if concurrency < 1:
+            raise ValueError("Concurrency must be a positive integer.")
+
+        # Discard a per-call system prompt, warning the caller
+        self._pop_system_prompt(kwargs)
+
+        if not self.model_version.startswith(COMPLETION_MODEL_PREFIXES):
+            # The async client's connections are bound to the event loop that opened them,
+            # so the prompts are sent with the shared sync client instead of a new event loop per call
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(user_prompts)) or 1) as executor:
+                responses = list(executor.map(
+                    lambda user_prompt: self._complete(user_prompt, is_rag, None, max_tokens, kwargs),
+                    user_prompts
+                ))
+
+            return {
+                "status": True,
+                "message": "Responses generated successfully.",
+                "choices": [[choice.message.content for choice in response.choices] for response in responses],
+                "model": self.model_name,
+                "usage": self._total_usage([response.usage for response in responses])
+            }
+
+        prompts = user_prompts
         if is_rag:
-            # Ensure retriever is set for RAG
-            self._check_retriever()
-
-            # Check if retriever has embeddings generated
-            self._check_embeddings()
-
-            # Generate response using OpenAI's chat completions
-            response = self.client.chat.completions.create(
-                model=self.model_version,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": self.system_prompt if 'system_prompt' not in kwargs else kwargs.get('system_prompt', 'You are a helpful assistant.')
-                    },
-                    {
-                        "role": "user", 
-                        "content": user_prompt
-                    },
-                    {
-                        "role": "assistant", 
-                        "content": self.retriever.retrieve(user_prompt)
-                    }
-                ],
-                max_tokens=max_tokens,
-                **kwargs
-            )
-        else:
-            response = self.client.chat.completions.create(
-                model=self.model_version,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": self.system_prompt if 'system_prompt' not in kwargs else kwargs.get('system_prompt', 'You are a helpful assistant.')
-                    },
-                    {
-                        "role": "user", 
-                        "content": user_prompt
-                    }
-                ],
-                max_tokens=max_tokens,
-                **kwargs
+            prompts = [
+                "\n".join([*map(format_context, self._retrieve_chunks(user_prompt)), user_prompt])
+                for user_prompt in user_prompts
+            ]
+
+        response = self._create_completion(
+            self.client.completions.create,
+            model=self.model_version,
+            prompt=prompts,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+
+        # Choices are returned in order of their index, with n choices per prompt
+        n = kwargs.get('n') or 1
+        choices = [[] for _ in user_prompts]
+        for choice in sorted(response.choices, key=lambda choice: choice.index):
+            choices[choice.index // n].append(choice.text)
+
+        return {
+            "status": True,
+            "message": "Responses generated successfully.",
+            "choices": choices,
+            "model": self.model_name,
+            "usage": self._total_usage([response.usage])
+        }
+
+    def generate_batch(
+        self,
+        user_prompts: list[str],
+        is_rag: bool = False,
+        max_tokens: int = 1000,
+        poll_interval: float = 30,
+        **kwargs: Any
+    ) -> list[WrapperResponse]:
+        """
+        Generate responses for multiple prompts through the OpenAI Batch API.
+        Batch jobs are cheaper and have separate rate limits, but may take up to 24 hours to complete,
+        so this is only suitable for workloads that are not latency-sensitive.
+
+        :param user_prompts: The user prompts to generate responses for.
+        :param is_rag: Whether to include the retrieved context.
+        :param max_tokens: The maximum number of tokens to generate per prompt.
+        :param poll_interval: The number of seconds to wait between batch status checks.
+        :param kwargs: Additional parameters for the OpenAI API.
+        :return: A list of response dictionaries, in the same order as the prompts.
+
+        :raises ValueError: If the model is not initialized or if the retriever is not set.
+        :raises EmbeddingError: If the retriever does not have embeddings generated.
+        :raises GenerationError: If the batch job does not complete.
+        """
+
+        # Discard a per-call system prompt, warning the caller
+        self._pop_system_prompt(kwargs)
+
+        # Build one chat completion request per prompt
+        lines = []
+        for i, user_prompt in enumerate(user_prompts):
+            request_kwargs = dict(kwargs)
+            messages = self._build_messages(user_prompt, is_rag, request_kwargs)
+
+            lines.append(json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model_version,
+                    "messages": messages,
+                    "max_tokens": max_tokens,
+                    **request_kwargs.pop('extra_body', {}),
+                    **request_kwargs
+                }
+            }))
+
+        # Upload the requests and submit the batch job, as bytes so that a retried upload sends the whole file again
+        batch_file = self._create_completion(
+            self.client.files.create,
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self._create_completion(
+            self.client.batches.create,
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        # Wait for the batch job to finish
+        while batch.status not in {"completed", "failed", "expired", "cancelled"}:
+            time.sleep(poll_interval)
+            batch = self._create_completion(self.client.batches.retrieve, batch_id=batch.id)
+
+        if batch.status != "completed":
+            raise GenerationError(f"Batch '{batch.id}' did not complete, status: '{batch.status}'.")
+
+        # Collect the results of successful and failed requests
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id is None:
+                continue
+
+            for line in self._create_completion(self.client.files.content, file_id=file_id).text.splitlines():
+                if not line.strip():
+                    continue
+
+                result = json.loads(line)
+                results[result["custom_id"]] = self._wrap_batch_result(result)
+
+        return [
+            results.get(str(i), {
+                "status": False,
+                "message": "No result returned for prompt.",
+                "choices": [],
+                "model": self.model_name,
+                "usage": None
+            })
+            for i in range(len(user_prompts))
+        ]
+
+    def _warmup(self, messages: list[dict[str, str]], prompt_cache_key: str) -> None:
+        """
+        Send a one-token request that fills the server-side prompt cache for the given messages.
+
+        :param messages: The chat messages to warm up.
+        :param prompt_cache_key: The prompt cache key to route the request with.
+        """
+
+        # Without cache keys, only the backend's prefix cache is warmed up
+        extra_body = {"prompt_cache_key": prompt_cache_key} if self._prompt_cache_key else {}
+
+        self._create_completion(
+            self.client.chat.completions.create,
+            model=self.model_version,
+            messages=messages,
+            max_tokens=1,
+            extra_body=extra_body
+        )
+
+    def _build_messages(
+        self, 
+        user_prompt: str,
+        is_rag: bool,
+        kwargs: dict[str, Any],
+        chunks: Optional[list[str]] = None
+    ) -> list[dict[str, str]]:
+        """
+        Build the chat messages for a completion request.
+
+        :param user_prompt: The user prompt to generate a response for.
+        :param is_rag: Whether to include the retrieved context.
+        :param kwargs: The additional parameters passed to the generation call.
+            Updated in place with the prompt cache key.
+        :param chunks: Already retrieved context chunks, retrieved from the retriever if not given.
+        :return: A list of chat messages.
+
+        :raises ValueError: If the model is not initialized or if the retriever is not set.
+        :raises EmbeddingError: If the retriever does not have embeddings generated.
+        """
+
+        # Check if model is instantiated
+        self._check_client()
+
+        system_prompt = self.system_prompt or DEFAULT_SYSTEM_PROMPT
+        prompt_cache_key = ResponseCache.make_key(self.model_version, system_prompt)
+
+        # Keep the static system prompt first and the varying parts last
+        messages = [
+            {
+                "role": "system",
+                "content": system_prompt
+            }
+        ]
+
+        if is_rag:
+            # Send each chunk separately, so their prefixes match any warmed up by precompute_kv()
+            if chunks is None:
+                chunks = self._retrieve_chunks(user_prompt)
+            messages.extend({"role": "user", "content": format_context(chunk)} for chunk in chunks)
+
+            if chunks:
+                prompt_cache_key = self.retriever.chunk_cache_keys.get(chunks[0], prompt_cache_key)
+
+        # Route requests sharing the same prefix to the same prompt cache
+        if self._prompt_cache_key:
+            kwargs['extra_body'] = {
+                "prompt_cache_key": prompt_cache_key,
+                **kwargs.get('extra_body', {})
+            }
+
+        messages.append({
+            "role": "user",
+            "content": user_prompt
+        })
+
+        return messages
+
+    def _pop_system_prompt(self, kwargs: dict[str, Any]) -> None:
+        """
+        Remove a per-call system prompt from the API parameters.
+        Must be called directly from a public method, so that the warning points at its caller.
+        Per-call system prompts change the prompt prefix, which defeats server-side prompt caching,
+        and are not a valid OpenAI API parameter.
+
+        :param kwargs: The additional parameters passed to the generation call.
+        """
+
+        if 'system_prompt' in kwargs:
+            kwargs.pop('system_prompt')
+            warnings.warn(
+                "Passing system_prompt per call is deprecated and ignored. Set it with configure() instead.",
+                DeprecationWarning,
+                stacklevel=3
             )
 
+    def _retrieve_chunks(self, user_prompt: str) -> list[str]:
+        """
+        Retrieve the context chunks for a prompt.
+
+        :param user_prompt: The user prompt to retrieve context for.
+        :return: A list of retrieved chunks.
+
+        :raises ValueError: If the retriever is not set.
+        :raises EmbeddingError: If the retriever does not have embeddings generated.
+        """
+
+        # Ensure retriever is set and has embeddings generated for RAG
+        self._check_embeddings()
+
+        return self._as_chunks(self.retriever.retrieve(user_prompt))
+
+    async def _aretrieve_chunks(self, user_prompt: str) -> list[str]:
+        """
+        Asynchronously retrieve the context chunks for a prompt, keeping the final results of the retriever.
+
+        :param user_prompt: The user prompt to retrieve context for.
+        :return: A list of retrieved chunks.
+
+        :raises ValueError: If the retriever is not set.
+        :raises EmbeddingError: If the retriever does not have embeddings generated.
+        """
+
+        # Ensure retriever is set and has embeddings generated for RAG
+        self._check_embeddings()
+
+        chunks = []
+        async for refinement in self.retriever.aretrieve(user_prompt):
+            chunks = self._as_chunks(refinement)
+
+        return chunks
+
+    @staticmethod
+    def _as_chunks(context: Any) -> list[str]:
+        """
+        Normalize retrieved context into a list of chunks.
+
+        :param context: The context returned by the retriever.
+        :return: A list of retrieved chunks.
+        """
+
+        return context if isinstance(context, list) else [context]
+
+    def _complete(
+        self,
+        user_prompt: str,
+        is_rag: bool,
+        chunks: Optional[list[str]],
+        max_tokens: int,
+        kwargs: dict[str, Any]
+    ) -> Any:
+        """
+        Send a chat completion request with the sync client.
+
+        :param user_prompt: The user prompt to generate a response for.
+        :param is_rag: Whether to include the retrieved context.
+        :param chunks: Already retrieved context chunks, retrieved from the retriever if not given.
+        :param max_tokens: The maximum number of tokens to generate.
+        :param kwargs: The additional parameters passed to the generation call, left unchanged.
+        :return: The decoded chat completion.
+        """
+
+        request_kwargs = dict(kwargs)
+        messages = self._build_messages(user_prompt, is_rag, request_kwargs, chunks=chunks)
+
+        # Generate response using OpenAI's chat completions
+        raw = self._create_completion(
+            self.client.with_raw_response.chat.completions.create,
+            model=self.model_version,
+            messages=messages,
+            max_tokens=max_tokens,
+            **request_kwargs
+        )
+
+        return _CHAT_RESPONSE_DECODER.decode(raw.content)
+
+    async def _acomplete(
+        self,
+        user_prompt: str,
+        is_rag: bool,
+        chunks: Optional[list[str]],
+        max_tokens: int,
+        kwargs: dict[str, Any]
+    ) -> Any:
+        """
+        Send a chat completion request with the async client.
+
+        :param user_prompt: The user prompt to generate a response for.
+        :param is_rag: Whether to include the retrieved context.
+        :param chunks: Already retrieved context chunks, retrieved from the retriever if not given.
+        :param max_tokens: The maximum number of tokens to generate.
+        :param kwargs: The additional parameters passed to the generation call, left unchanged.
+        :return: The decoded chat completion.
+        """
+
+        request_kwargs = dict(kwargs)
+        messages = self._build_messages(user_prompt, is_rag, request_kwargs, chunks=chunks)
+
+        # Generate response using OpenAI's async chat completions
+        raw = await self._acreate_completion(
+            self.aclient.with_raw_response.chat.completions.create,
+            model=self.model_version,
+            messages=messages,
+            max_tokens=max_tokens,
+            **request_kwargs
+        )
+
+        return _CHAT_RESPONSE_DECODER.decode(raw.content)
+
+    @retry(
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        stop=stop_after_attempt(6),
+        reraise=True
+    )
+    def _create_completion(self, create: Callable[..., Any], **params: Any) -> Any:
+        """
+        Send an API request within the rate limits, retrying transient errors.
+
+        :param create: The client method that sends the request.
+        :param params: The parameters of the request.
+        :return: The response returned by the OpenAI API.
+        """
+
+        self._bucket.acquire(self._estimate_tokens(params))
+
+        try:
+            return create(**params)
+        except BadRequestError as e:
+            if not self._drop_prompt_cache_key(params, e):
+                raise
+
+        return create(**params)
+
+    @retry(
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        stop=stop_after_attempt(6),
+        reraise=True
+    )
+    async def _acreate_completion(self, create: Callable[..., Any], **params: Any) -> Any:
+        """
+        Asynchronously send a completion or embedding request within the rate limits, retrying transient errors.
+
+        :param create: The async client method that sends the request.
+        :param params: The parameters of the request.
+        :return: The response returned by the OpenAI API.
+        """
+
+        await self._bucket.aacquire(self._estimate_tokens(params))
+
+        try:
+            return await create(**params)
+        except BadRequestError as e:
+            if not self._drop_prompt_cache_key(params, e):
+                raise
+
+        return await create(**params)
+
+    def _drop_prompt_cache_key(self, params: dict[str, Any], error: BadRequestError) -> bool:
+        """
+        Stop sending prompt cache keys once the backend rejects one.
+
+        :param params: The parameters of the rejected request, updated in place.
+        :param error: The error returned by the OpenAI API.
+        :return: True if the request was rejected for its prompt cache key and can be resent without it.
+        """
+
+        extra_body = params.get('extra_body') or {}
+        if 'prompt_cache_key' not in extra_body or 'prompt_cache_key' not in str(error):
+            return False
+
+        # Remember that the backend does not accept cache keys
+        self._prompt_cache_key = False
+        params['extra_body'] = {key: value for key, value in extra_body.items() if key != 'prompt_cache_key'}
+
+        return True
+
+    @staticmethod
+    def _estimate_tokens(params: dict[str, Any]) -> int:
+        """
+        Estimate the number of tokens a request uses, at roughly 4 characters per prompt token.
+
+        :param params: The parameters of the request.
+        :return: The estimated number of prompt and completion tokens.
+        """
+
+        prompt = params.get('prompt', [])
+        prompts = [prompt] if isinstance(prompt, str) else prompt
+        inputs = params.get('input', [])
+
+        texts = [message.get('content') or '' for message in params.get('messages', [])]
+        texts += prompts
+        texts += [inputs] if isinstance(inputs, str) else inputs
+
+        completions = len(prompts) if 'prompt' in params else 1
+        completions *= params.get('n') or 1
+
+        return sum(len(text) for text in texts) // 4 + (params.get('max_tokens') or 0) * completions
+
+    @staticmethod
+    def _embedding_batches(texts: list[str], batch_size: int) -> list[list[str]]:
+        """
+        Split texts into batches for the embeddings endpoint.
+
+        :param texts: The texts to embed.
+        :param batch_size: The number of texts per batch.
+        :return: A list of batches.
+
+        :raises ValueError: If the batch size is not between 1 and 2048.
+        """
+
+        if not 1 <= batch_size <= MAX_EMBEDDING_BATCH_SIZE:
+            raise ValueError(f"Batch size must be between 1 and {MAX_EMBEDDING_BATCH_SIZE}.")
+
+        return [texts[i * batch_size:(i + 1) * batch_size] for i in range(math.ceil(len(texts) / batch_size))]
+
+    @staticmethod
+    def _stack_embeddings(batches: list[np.ndarray]) -> np.ndarray:
+        """
+        Stack batches of embeddings into one matrix.
+
+        :param batches: The embeddings of each batch, in order.
+        :return: A float32 matrix with one row per text.
+        """
+
+        if not batches:
+            return np.empty((0, 0), dtype=np.float32)
+
+        return np.concatenate(batches)
+
+    @staticmethod
+    def _total_usage(usages: list[Any]) -> Optional[Usage]:
+        """
+        Sum the token usage of several responses.
+
+        :param usages: The usage of each response, None where the backend did not report it.
+        :return: The total usage, or None if no response reported it.
+        """
+
+        usages = [usage for usage in usages if usage is not None]
+        if not usages:
+            return None
+
+        return Usage(
+            prompt_tokens=sum(usage.prompt_tokens for usage in usages),
+            completion_tokens=sum(usage.completion_tokens for usage in usages),
+            total_tokens=sum(usage.total_tokens for usage in usages)
+        )
+
+    def _wrap_response(self, response: Any) -> WrapperResponse:
+        """
+        Convert a chat completion into the wrapper response format.
+
+        :param response: The chat completion returned by the OpenAI API.
+        :return: A dictionary containing the generated choices and metadata.
+        """
+
         # Return all generated choices and metadata 
         return {
             "status": True,
@@ -211,6 +1216,36 @@ class OpenAILLM(BaseLLM):
             "usage": response.usage
         }
 
+    def _wrap_batch_result(self, result: dict[str, Any]) -> WrapperResponse:
+        """
+        Convert a line of a batch output file into the wrapper response format.
+
+        :param result: The parsed batch output line.
+        :return: A dictionary containing the generated choices and metadata.
+        """
+
+        response = result.get("response") or {}
+        if result.get("error") or response.get("status_code") != 200:
+            error = result.get("error") or response.get("body", {}).get("error") or {}
+
+            return {
+                "status": False,
+                "message": f"Failed to generate response: {error.get('message', 'unknown error')}",
+                "choices": [],
+                "model": self.model_name,
+                "usage": None
+            }
+
+        body = response["body"]
+
+        return {
+            "status": True,
+            "message": "Response generated successfully.",
+            "choices": [choice["message"]["content"] for choice in body["choices"]],
+            "model": self.model_name,
+            "usage": body.get("usage")
+        }
+
     def _check_client(self) -> None:
         """
         Check if the OpenAI client is initialized.
@@ -218,9 +1253,20 @@ class OpenAILLM(BaseLLM):
         :raises ValueError: If the OpenAI client is not initialized.
         """
 
-        if not hasattr(self, 'client') and not hasattr(self, 'models'):
+        # Available models are listed lazily by configure(), so only the client is required
+        if getattr(self, 'client', None) is None:
             raise ValueError("OpenAI client is not initialized.")
 
+    def _check_model_version(self) -> None:
+        """
+        Check if the model version is configured.
+
+        :raises ValueError: If the model version is not configured.
+        """
+
+        if not getattr(self, 'model_version', None):
+            raise ValueError("Model version is not set. Please configure the model version first.")
+
     def _check_retriever(self) -> None:
         """
         Check if the retriever is set.
@@ -228,7 +1274,7 @@ class OpenAILLM(BaseLLM):
         :raises ValueError: If the retriever is not set.
         """
 
-        if not hasattr(self, 'retriever'):
+        if getattr(self, 'retriever', None) is None:
             raise ValueError("Retriever is not set. Please configure the retriever before embedding.")
 
     def _check_embeddings(self) -> None:
@@ -239,7 +1285,10 @@ class OpenAILLM(BaseLLM):
         :raises EmbeddingError: If the retriever does not have embeddings generated.
         """
 
-        self._check_retriever()
+        # Single lookup of the retriever on the RAG hot path
+        retriever = getattr(self, 'retriever', None)
+        if retriever is None:
+            raise ValueError("Retriever is not set. Please configure the retriever before embedding.")
 
-        if not self.retriever.has_embedding():
+        if not retriever.has_embedding():
             raise EmbeddingError("Embeddings have not been generated. Please call the embed() method first.")
@@ -10,12 +10,29 @@ This class defines the interface for retrievers that can be used with LLMs in Ho
 """
 
 # Python Standard Library imports
+import asyncio
+from hashlib import blake2b
+import json
+from typing import Any, AsyncIterator, Callable
 
 # Third-party imports
 
 # Local imports
 
 
+def format_context(chunk: str) -> str:
+    """
+    Format a retrieved chunk as a context message.
+
+    Args:
+        chunk (str): The retrieved chunk.
+
+    Returns:
+        str: The chunk wrapped in context tags.
+    """
+    return f"<context>\n{chunk}\n</context>"
+
+
 class BaseRetriever:
     """
     Base class for all retrievers.
@@ -23,6 +40,12 @@ class BaseRetriever:
     It provides a common interface for retrieval operations.
     """
 
+    # Prompt cache keys of chunks warmed up with precompute_kv
+    chunk_cache_keys: dict[str, str] = {}
+
+    # Whether embed() and aembed() receive the LLM wrapper instead of its OpenAI client
+    embeds_with_wrapper: bool = False
+
     def retrieve(self, query: str, top_k: int = 10):
         """
         Retrieve documents based on the query.
@@ -35,3 +58,58 @@ class BaseRetriever:
             list: A list of retrieved documents.
         """
         raise NotImplementedError("Subclasses must implement this method.")
+
+    async def aretrieve(self, query: str, top_k: int = 10) -> AsyncIterator[list]:
+        """
+        Asynchronously retrieve documents, yielding progressively refined results.
+        The last yielded list is the final result. The default implementation yields the result
+        of retrieve() once. Generation starts a speculative request with the first list and sends
+        it again when the final list differs, so retrievers should only yield more than once when
+        their first result is likely to equal the final result.
+
+        Args:
+            query (str): The query string to search for.
+            top_k (int): The number of top results to return.
+
+        Yields:
+            list: A list of retrieved documents.
+        """
+        yield await asyncio.to_thread(self.retrieve, query, top_k)
+
+    def precompute_kv(
+        self,
+        warmup: Callable[[list[dict[str, str]], str], Any],
+        model_version: str,
+        system_prompt: str,
+        chunks: list[str]
+    ) -> list[str]:
+        """
+        Warm up the server-side prompt cache for each chunk.
+        Each chunk is sent once behind the system prompt, so later requests that start with the
+        same system prompt and chunk can reuse the cached prefill instead of recomputing it.
+
+        Args:
+            warmup (Callable): Sends a warmup request for the given messages and prompt cache key,
+                such as the one provided by the LLM wrapper's precompute_kv().
+            model_version (str): The model version to warm up.
+            system_prompt (str): The system prompt that precedes the chunks in requests.
+            chunks (list[str]): The chunks to warm up.
+
+        Returns:
+            list[str]: The prompt cache key of each chunk.
+        """
+        keys = []
+        for chunk in chunks:
+            key = blake2b(json.dumps([model_version, system_prompt, chunk]).encode("utf-8")).hexdigest()
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": format_context(chunk)}
+            ]
+
+            warmup(messages, key)
+            keys.append(key)
+
+        # Assign rather than update, so the class-level default is never shared
+        self.chunk_cache_keys = {**self.chunk_cache_keys, **dict(zip(chunks, keys))}
+
+        return keys
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+
+"""
+Dense vector Retriever Class in HooRAGLib.
+This class ranks documents by cosine similarity between their embeddings and the query embedding.
+
+:author: Hoo-dkwozD
+:version: 1.0.0
+:date: 2025-07-14
+"""
+
+# Python Standard Library imports
+import asyncio
+from typing import Any, AsyncIterator, Iterator, Optional
+
+# Third-party imports
+import numpy as np
+
+# Local imports
+from HooRAGLib.Helpers.Errors import EmbeddingError
+from HooRAGLib.Retrievers.BaseRetriever import BaseRetriever
+
+
+class DenseRetriever(BaseRetriever):
+    """
+    Retriever that ranks documents by the cosine similarity of their embeddings to the query.
+    Embeddings are L2-normalized once at index time, so scoring a query is a single matrix-vector product.
+    The "faiss" backend uses an exact inner product index and is better suited to very large corpora.
+    With `quantize`, embeddings are stored as int8 with a per-row scale, a quarter of the float32 size.
+    """
+
+    # Documents and queries are embedded with the wrapper's batched, rate limited embed_texts
+    embeds_with_wrapper = True
+
+    def __init__(
+        self,
+        documents: list[str],
+        embedding_model: str = "text-embedding-3-small",
+        backend: str = "numpy",
+        quantize: bool = False,
+        tile_size: int = 4096
+    ):
+        """
+        Initialize the retriever with the documents to retrieve from.
+
+        Args:
+            documents (list[str]): The documents to retrieve from.
+            embedding_model (str): The embedding model used for documents and queries.
+            backend (str): The search backend, either "numpy" or "faiss".
+            quantize (bool): Whether to store the embeddings as int8.
+            tile_size (int): The number of documents scored at once by the "numpy" backend.
+
+        Raises:
+            ValueError: If the backend is not supported or the tile size is not positive.
+        """
+        if backend not in ("numpy", "faiss"):
+            raise ValueError(f"Backend '{backend}' is not supported. Use 'numpy' or 'faiss'.")
+        if tile_size < 1:
+            raise ValueError("Tile size must be a positive integer.")
+
+        self.documents = documents
+        self.embedding_model = embedding_model
+        self.backend = backend
+        self.quantize = quantize
+        self.tile_size = tile_size
+
+        self._embeddings: Optional[np.ndarray] = None
+        self._emb_i8: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._index: Any = None
+        self._client: Any = None
+
+    def embed(self, client: Any) -> dict[str, Any]:
+        """
+        Embed and index the documents.
+
+        Args:
+            client: The embedding client used for the documents and later queries, such as an OpenAILLM.
+                It must provide embed_texts() and aembed_texts().
+
+        Returns:
+            dict: The document embeddings as a float32 matrix under "data".
+        """
+        embeddings = client.embed_texts(self.documents, model=self.embedding_model)
+        self.index(embeddings, client=client)
+
+        return {"data": embeddings}
+
+    async def aembed(self, client: Any) -> dict[str, Any]:
+        """
+        Asynchronously embed and index the documents.
+
+        Args:
+            client: The embedding client used for the documents and later queries, such as an OpenAILLM.
+                It must provide embed_texts() and aembed_texts().
+
+        Returns:
+            dict: The document embeddings as a float32 matrix under "data".
+        """
+        embeddings = await client.aembed_texts(self.documents, model=self.embedding_model)
+        self.index(embeddings, client=client)
+
+        return {"data": embeddings}
+
+    def has_embedding(self) -> bool:
+        """
+        Check if the documents have been embedded.
+
+        Returns:
+            bool: True if the documents are indexed.
+        """
+        return any(store is not None for store in (self._embeddings, self._emb_i8, self._index))
+
+    def index(self, embeddings: np.ndarray, client: Any = None) -> None:
+        """
+        Index precomputed document embeddings.
+
+        Args:
+            embeddings (np.ndarray): The document embeddings, one row per document.
+            client: The embedding client used for later queries, such as an OpenAILLM.
+                The current client is kept if not given.
+
+        Raises:
+            ValueError: If there are no documents or the number of embeddings does not match the number of documents.
+        """
+        if not self.documents:
+            raise ValueError("There are no documents to index.")
+        if len(embeddings) != len(self.documents):
+            raise ValueError("The number of embeddings must match the number of documents.")
+
+        if client is not None:
+            self._client = client
+
+        embeddings = self._normalize(np.asarray(embeddings, dtype=np.float32))
+
+        if self.backend == "faiss":
+            try:
+                import faiss
+            except ImportError as e:
+                raise ImportError("The 'faiss' backend requires faiss-cpu or faiss-gpu to be installed.") from e
+
+            if self.quantize:
+                self._index = faiss.IndexScalarQuantizer(
+                    embeddings.shape[1], faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+                )
+                self._index.train(embeddings)
+            else:
+                self._index = faiss.IndexFlatIP(embeddings.shape[1])
+            self._index.add(embeddings)
+
+            # The index holds its own copy of the embeddings
+            return
+
+        if self.quantize:
+            # Only keep the quantized copy, so the float32 matrix can be freed
+            self._emb_i8, self._scales = self._quantize(embeddings)
+            self._embeddings = None
+        else:
+            self._embeddings = embeddings
+
+    def retrieve(self, query: str, top_k: int = 10) -> list[str]:
+        """
+        Retrieve the documents most similar to the query.
+
+        Args:
+            query (str): The query string to search for.
+            top_k (int): The number of top results to return.
+
+        Returns:
+            list[str]: The retrieved documents, most similar first.
+
+        Raises:
+            EmbeddingError: If the documents are not indexed or there is no client to embed the query with.
+        """
+        if not self.has_embedding():
+            raise EmbeddingError("Embeddings have not been generated. Please call the embed() method first.")
+        if self._client is None:
+            raise EmbeddingError("No client to embed queries with. Pass a client to index() or call the embed() method.")
+
+        query_embedding = self._client.embed_texts([query], model=self.embedding_model)[0]
+        indices, _ = self.search(query_embedding, top_k)
+
+        return [self.documents[i] for i in indices]
+
+    async def aretrieve(self, query: str, top_k: int = 10) -> AsyncIterator[list]:
+        """
+        Asynchronously retrieve the documents most similar to the query.
+        Embeds the query with the async method of the embedding client and yields the final top-k once.
+        The top-k of the first tile rarely survives the remaining tiles, so it is not yielded as an early
+        result; the event loop is released between tiles instead.
+
+        Args:
+            query (str): The query string to search for.
+            top_k (int): The number of top results to return.
+
+        Yields:
+            list[str]: The retrieved documents, most similar first.
+        """
+        if self._client is None or not self.has_embedding():
+            async for documents in super().aretrieve(query, top_k):
+                yield documents
+            return
+
+        query_embedding = (await self._client.aembed_texts([query], model=self.embedding_model))[0]
+
+        if self._index is not None:
+            indices, _ = self.search(query_embedding, top_k)
+            yield [self.documents[i] for i in indices]
+            return
+
+        queries = self._normalize(np.asarray(query_embedding, dtype=np.float32)[np.newaxis, :])
+        for indices, scores in self._search_tiles(queries, min(top_k, len(self.documents))):
+            # Let other tasks run between tiles
+            await asyncio.sleep(0)
+
+        yield [self.documents[i] for i in self._sort_results(indices, scores)[0][0]]
+
+    def search(self, query_embedding: np.ndarray, top_k: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the documents with the highest cosine similarity to a query embedding.
+
+        Args:
+            query_embedding (np.ndarray): The query embedding.
+            top_k (int): The number of top results to return.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The document indices and scores, highest score first.
+        """
+        indices, scores = self.search_batch(np.asarray(query_embedding)[np.newaxis, :], top_k)
+
+        return indices[0], scores[0]
+
+    def search_batch(self, query_embeddings: np.ndarray, top_k: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the documents with the highest cosine similarity to each of a batch of query embeddings.
+        Documents are scored in tiles of `tile_size` rows against all queries at once, keeping a running
+        top-k per query, so the embedding matrix is read once per batch and temporaries stay tile-sized.
+
+        Args:
+            query_embeddings (np.ndarray): The query embeddings, one row per query.
+            top_k (int): The number of top results to return per query.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The document indices and scores per query, highest score first.
+        """
+        queries = self._normalize(np.asarray(query_embeddings, dtype=np.float32))
+        top_k = min(top_k, len(self.documents))
+
+        if self._index is not None:
+            scores, indices = self._index.search(queries, top_k)
+
+            return indices, scores
+
+        for indices, scores in self._search_tiles(queries, top_k):
+            pass
+
+        return self._sort_results(indices, scores)
+
+    def _search_tiles(self, queries: np.ndarray, top_k: int) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Score the documents tile by tile, yielding the running top-k after each tile.
+
+        Args:
+            queries (np.ndarray): The normalized query embeddings, one row per query.
+            top_k (int): The number of top results to keep per query, at most the number of documents.
+
+        Yields:
+            tuple[np.ndarray, np.ndarray]: The document indices and scores per query so far, in no particular order.
+        """
+        best_indices = np.empty((len(queries), 0), dtype=np.int64)
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        if top_k < 1:
+            yield best_indices, best_scores
+            return
+
+        for start in range(0, len(self.documents), self.tile_size):
+            stop = min(start + self.tile_size, len(self.documents))
+
+            if self._emb_i8 is not None:
+                # Dequantize one tile at a time, so the product still runs through float32 BLAS
+                block = self._emb_i8[start:stop].astype(np.float32) @ queries.T
+                block *= self._scales[start:stop, np.newaxis]
+            else:
+                block = self._embeddings[start:stop] @ queries.T
+            block = block.T
+
+            # Partial selection of the top-k of the tile, merged into the running top-k
+            block_indices = self._top_k(block, top_k)
+            candidate_indices = np.concatenate([best_indices, block_indices + start], axis=1)
+            candidate_scores = np.concatenate([best_scores, np.take_along_axis(block, block_indices, axis=1)], axis=1)
+
+            keep = self._top_k(candidate_scores, top_k)
+            best_indices = np.take_along_axis(candidate_indices, keep, axis=1)
+            best_scores = np.take_along_axis(candidate_scores, keep, axis=1)
+
+            yield best_indices, best_scores
+
+    @staticmethod
+    def _sort_results(indices: np.ndarray, scores: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Sort a top-k selection by score.
+
+        Args:
+            indices (np.ndarray): The document indices, one row per query.
+            scores (np.ndarray): The scores, one row per query.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The document indices and scores per query, highest score first.
+        """
+        order = np.argsort(-scores, axis=1, kind="stable")
+
+        return np.take_along_axis(indices, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, top_k: int) -> np.ndarray:
+        """
+        Select the positions of the top-k scores in each row, in no particular order.
+
+        Args:
+            scores (np.ndarray): The scores, one row per query.
+            top_k (int): The number of positions to select per row.
+
+        Returns:
+            np.ndarray: The selected positions per row.
+        """
+        if top_k >= scores.shape[1]:
+            return np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+
+        return np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+
+    @staticmethod
+    def _quantize(embeddings: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Quantize embeddings to int8 with a symmetric scale per row.
+
+        Args:
+            embeddings (np.ndarray): The embeddings to quantize.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The int8 embeddings and the float32 scale of each row.
+        """
+        scales = np.abs(embeddings).max(axis=-1, keepdims=True) / 127
+        scales = np.where(scales == 0, 1, scales).astype(np.float32)
+        quantized = np.round(embeddings / scales).clip(-127, 127).astype(np.int8)
+
+        return quantized, np.squeeze(scales, axis=-1)
+
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize embeddings along the last axis.
+
+        Args:
+            embeddings (np.ndarray): The embeddings to normalize.
+
+        Returns:
+            np.ndarray: The normalized embeddings.
+        """
+        norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+
+        return embeddings / np.where(norms == 0, 1, norms)
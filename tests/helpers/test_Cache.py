@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+"""
+Test suite for the response cache in HooRAGLib.
+
+:author: Hoo-dkwozD
+:version: 1.0.0
+:date: 2025-07-14
+"""
+
+# Python Standard Library imports
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local imports
+from HooRAGLib.Helpers.Cache import ResponseCache
+
+
+def test_response_cache_evicts_least_recently_used():
+    """Test the cache evicts the least recently used entry when full."""
+
+    cache = ResponseCache(capacity=2)
+    cache.put("a", {"choices": ["a"]})
+    cache.put("b", {"choices": ["b"]})
+
+    assert cache.get("a") == {"choices": ["a"]}
+
+    cache.put("c", {"choices": ["c"]})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"choices": ["a"]}
+    assert len(cache) == 2
+
+def test_response_cache_returns_copies():
+    """Test updating a stored or returned response does not change the cached entry."""
+
+    cache = ResponseCache(capacity=1)
+    response = {"choices": ["a"]}
+    cache.put("a", response)
+    response["status"] = False
+
+    response["choices"].append("b")
+
+    cached = cache.get("a")
+    cached["choices"].append("c")
+    cached["choices"] = []
+
+    assert cache.get("a") == {"choices": ["a"]}
+
+def test_response_cache_semantic_match_within_scope():
+    """Test similar prompts match only within the same scope."""
+
+    cache = ResponseCache(capacity=2, threshold=0.97)
+    cache.put("a", {"choices": ["a"]}, scope="scope-1", embedding=np.array([1.0, 0.0]))
+
+    assert cache.get_similar("scope-1", np.array([0.99, 0.01])) == {"choices": ["a"]}
+    assert cache.get_similar("scope-2", np.array([0.99, 0.01])) is None
+    assert cache.get_similar("scope-1", np.array([0.0, 1.0])) is None
+
+def test_response_cache_reuses_evicted_rows():
+    """Test evicted entries no longer match semantically."""
+
+    cache = ResponseCache(capacity=1, threshold=0.97)
+    cache.put("a", {"choices": ["a"]}, scope="scope", embedding=np.array([1.0, 0.0]))
+    cache.put("b", {"choices": ["b"]}, scope="scope", embedding=np.array([0.0, 1.0]))
+
+    assert cache.get_similar("scope", np.array([1.0, 0.0])) is None
+    assert cache.get_similar("scope", np.array([0.0, 1.0])) == {"choices": ["b"]}
+
+def test_response_cache_negative_capacity():
+    """Test a negative capacity raises ValueError."""
+
+    with pytest.raises(ValueError, match="Cache capacity must not be negative."):
+        ResponseCache(capacity=-1)
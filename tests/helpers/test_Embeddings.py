@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+"""
+Test suite for the embedding helpers in HooRAGLib.
+
+:author: Hoo-dkwozD
+:version: 1.0.0
+:date: 2025-07-14
+"""
+
+# Python Standard Library imports
+import base64
+
+# Third-party imports
+import numpy as np
+
+# Local imports
+from HooRAGLib.Helpers.Embeddings import decode_embeddings
+
+
+def test_decode_embeddings_base64_by_index(mocker):
+    """Test base64 embeddings are decoded into rows ordered by item index."""
+
+    vectors = np.array([[1.0, 2.0], [3.0, 4.0]], dtype=np.float32)
+    data = [
+        mocker.Mock(index=1, embedding=base64.b64encode(vectors[1].tobytes()).decode()),
+        mocker.Mock(index=0, embedding=base64.b64encode(vectors[0].tobytes()).decode()),
+    ]
+
+    decoded = decode_embeddings(data)
+
+    assert decoded.dtype == np.float32
+    assert np.array_equal(decoded, vectors)
+
+def test_decode_embeddings_float_lists(mocker):
+    """Test float list embeddings are accepted from backends that ignore the encoding format."""
+
+    decoded = decode_embeddings([mocker.Mock(index=0, embedding=[0.5, 0.25])])
+
+    assert np.array_equal(decoded, np.array([[0.5, 0.25]], dtype=np.float32))
+
+def test_decode_embeddings_empty():
+    """Test an empty response decodes to an empty matrix."""
+
+    assert decode_embeddings([]).shape == (0, 0)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+"""
+Test suite for the rate limiting helpers in HooRAGLib.
+
+:author: Hoo-dkwozD
+:version: 1.0.0
+:date: 2025-07-14
+"""
+
+# Python Standard Library imports
+
+# Third-party imports
+import pytest
+
+# Local imports
+from HooRAGLib.Helpers.RateLimit import TokenBucket
+
+
+def test_token_bucket_allows_burst_up_to_limits():
+    """Test requests within the limits do not wait."""
+
+    bucket = TokenBucket(rpm=2, tpm=100)
+
+    assert bucket._reserve(50) == 0
+    assert bucket._reserve(50) == 0
+
+def test_token_bucket_waits_for_refill(mocker):
+    """Test requests beyond the limits wait for the bucket to refill."""
+
+    mocker.patch('HooRAGLib.Helpers.RateLimit.time.monotonic', return_value=0.0)
+    bucket = TokenBucket(rpm=60, tpm=600)
+
+    assert bucket._reserve(600) == 0
+    assert bucket._reserve(60) == pytest.approx(6.0)
+    assert bucket._reserve(0) == pytest.approx(6.0)
+
+def test_token_bucket_invalid_limits():
+    """Test non-positive limits raise ValueError."""
+
+    with pytest.raises(ValueError, match="Rate limits must be positive."):
+        TokenBucket(rpm=0)
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+"""
+Test suite for the streaming helpers in HooRAGLib.
+
+:author: Hoo-dkwozD
+:version: 1.0.0
+:date: 2025-07-14
+"""
+
+# Python Standard Library imports
+
+# Third-party imports
+import pytest
+
+# Local imports
+from HooRAGLib.Helpers.Streaming import StreamBuffer
+
+
+def test_stream_buffer_grows_batches():
+    """Test the first delta is flushed immediately and later batches grow up to the maximum."""
+
+    buffer = StreamBuffer(min_batch_size=1, growth_factor=2.0, max_batch_size=4)
+    flushed = [text for text in (buffer.add(delta) for delta in "abcdefghij") if text]
+
+    assert flushed == ["a", "bc", "defg"]
+    assert buffer.flush() == "hij"
+
+def test_stream_buffer_invalid_sizes():
+    """Test invalid batch sizes raise ValueError."""
+
+    with pytest.raises(ValueError):
+        StreamBuffer(min_batch_size=4, max_batch_size=2)
@@ -9,10 +9,16 @@ Test suite for OpenAI LLM in HooRAGLib.
 """
 
 # Python Standard Library imports
+import asyncio
+import base64
+import json
 
 # Third-party imports
 import dotenv
+import httpx
+import numpy as np
 import pytest
+from openai import BadRequestError, RateLimitError
 
 # Local imports
 import HooRAGLib.Models.OpenAI
@@ -47,8 +53,38 @@ def mock_openai_client(mocker):
             mock_messages = 'abcde'.split('')
             self.chat.completions.create.return_value = [MockChatCompletionChoice(message=msg) for msg in mock_messages]
 
+    mocker.patch('HooRAGLib.Models.OpenAI.AsyncOpenAI')
+    mocker.patch.dict('HooRAGLib.Models.OpenAI._CLIENT_REGISTRY', clear=True)
+
     return mocker.patch('HooRAGLib.Models.OpenAI.OpenAI', return_value=MockOpenAIClient)
 
+@pytest.fixture
+def mock_clients(mocker):
+    """Fixture to mock both the sync and async OpenAI clients."""
+
+    client = mocker.Mock()
+    aclient = mocker.Mock()
+
+    def _completion(**kwargs):
+        content = kwargs['messages'][-1]['content']
+        choice = mocker.Mock()
+        choice.message.content = content
+        raw = json.dumps({"id": "chatcmpl-1", "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}]})
+        return mocker.Mock(choices=[choice], usage=None, content=raw.encode("utf-8"))
+
+    client.chat.completions.create.side_effect = _completion
+    aclient.chat.completions.create = mocker.AsyncMock(side_effect=_completion)
+
+    # Raw responses are served by the same mocks
+    client.with_raw_response = client
+    aclient.with_raw_response = aclient
+
+    mocker.patch('HooRAGLib.Models.OpenAI.OpenAI', return_value=client)
+    mocker.patch('HooRAGLib.Models.OpenAI.AsyncOpenAI', return_value=aclient)
+    mocker.patch.dict('HooRAGLib.Models.OpenAI._CLIENT_REGISTRY', clear=True)
+
+    return client, aclient
+
 def test_openai_llm_initialization(mocker, mock_openai_client):
     """Test the initialization of the OpenAI LLM."""
 
@@ -56,7 +92,7 @@ def test_openai_llm_initialization(mocker, mock_openai_client):
     model_name = "test-model"
     llm = OpenAILLM(model_name=model_name, test_1="test", test_2="test")
     assert llm.model_name == model_name
-    assert llm.models == ["gpt-3.5-turbo", "gpt-4"]
+    assert llm.models is None
 
     assert mock_openai_client.called
     assert mock_openai_client.call_args[1]['api_key'] == 'test-key'
@@ -94,3 +130,499 @@ def test_openai_llm_configure(mocker, mock_retriever, mock_openai_client):
     assert response['message'] == f"OpenAI model '{model_name}' configured successfully."
     assert response['model_version'] == model_version
     assert response['retriever'] == mock_retriever.__class__.__name__
+
+def test_openai_llm_agenerate_many(mocker, mock_clients):
+    """Test concurrent generation returns responses in prompt order."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    _, aclient = mock_clients
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+
+    responses = asyncio.run(llm.agenerate_many(["a", "b", "c"], is_rag=False, concurrency=2))
+
+    assert [response['choices'] for response in responses] == [["a"], ["b"], ["c"]]
+    assert aclient.chat.completions.create.await_count == 3
+
+def test_openai_llm_generate_batch(mocker, mock_clients):
+    """Test batch generation submits one request per prompt and returns results in prompt order."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, _ = mock_clients
+    client.batches.create.return_value = mocker.Mock(
+        id="batch-1", status="completed", output_file_id="file-out", error_file_id=None
+    )
+    client.files.content.return_value.text = "\n".join(
+        json.dumps({
+            "custom_id": custom_id,
+            "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}], "usage": None}},
+            "error": None
+        })
+        for custom_id, content in [("1", "b"), ("0", "a")]
+    )
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+
+    responses = llm.generate_batch(["a", "b"], poll_interval=0)
+
+    assert [response['choices'] for response in responses] == [["a"], ["b"]]
+    uploaded = client.files.create.call_args[1]['file'][1].decode("utf-8").splitlines()
+    assert [json.loads(line)['custom_id'] for line in uploaded] == ["0", "1"]
+
+def test_openai_llm_generate_multi_completion_model(mocker, mock_clients):
+    """Test multi-prompt generation sends one completions request and demultiplexes choices by index."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, _ = mock_clients
+    client.completions.create.return_value = mocker.Mock(
+        choices=[mocker.Mock(index=index, text=text) for index, text in [(3, "b2"), (0, "a1"), (2, "b1"), (1, "a2")]],
+        usage=mocker.Mock(prompt_tokens=2, completion_tokens=4, total_tokens=6)
+    )
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+
+    with pytest.raises(ValueError, match="Model version is not set."):
+        llm.generate_multi(["a", "b"])
+
+    llm.model_version = "gpt-3.5-turbo-instruct"
+
+    response = llm.generate_multi(["a", "b"], n=2)
+
+    assert client.completions.create.call_count == 1
+    assert client.completions.create.call_args[1]['prompt'] == ["a", "b"]
+    assert response['choices'] == [["a1", "a2"], ["b1", "b2"]]
+    assert response['usage'].total_tokens == 6
+
+def test_openai_llm_generate_multi_chat_model(mocker, mock_clients):
+    """Test multi-prompt generation for chat models can be called repeatedly without the async client."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, aclient = mock_clients
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+
+    assert llm.generate_multi(["a", "b"])['choices'] == [["a"], ["b"]]
+    assert llm.generate_multi(["c", "d", "e"], concurrency=2)['choices'] == [["c"], ["d"], ["e"]]
+
+    assert client.chat.completions.create.call_count == 5
+    assert not aclient.chat.completions.create.called
+
+def test_openai_llm_generate_uses_cache(mocker, mock_clients):
+    """Test repeated prompts are answered from the response cache."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, _ = mock_clients
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+
+    first = llm.generate("a", is_rag=False)
+    second = llm.generate("a", is_rag=False)
+    llm.generate("b", is_rag=False)
+
+    assert first == second
+    assert client.chat.completions.create.call_count == 2
+
+def test_openai_llm_generate_rag_message_order(mocker, mock_clients, mock_retriever):
+    """Test the system prompt comes first, followed by the retrieved context and the user prompt."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, _ = mock_clients
+    mock_retriever.retrieve.return_value = ["doc-1", "doc-2"]
+    mock_retriever.chunk_cache_keys = {"doc-1": "doc-1-key"}
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+    llm.system_prompt = "This is a test system prompt."
+    llm.retriever = mock_retriever
+
+    with pytest.warns(DeprecationWarning):
+        llm.generate("query", system_prompt="Per-call prompt.")
+
+    kwargs = client.chat.completions.create.call_args[1]
+    assert kwargs['messages'] == [
+        {"role": "system", "content": "This is a test system prompt."},
+        {"role": "user", "content": "<context>\ndoc-1\n</context>"},
+        {"role": "user", "content": "<context>\ndoc-2\n</context>"},
+        {"role": "user", "content": "query"}
+    ]
+    assert 'system_prompt' not in kwargs
+    assert kwargs['extra_body']['prompt_cache_key'] == "doc-1-key"
+
+def test_openai_llm_system_prompt_warns_once_at_caller(mocker, mock_clients, mock_retriever):
+    """Test a per-call system prompt warns once, pointing at the caller, even when a request is reissued."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    async def _aretrieve(query):
+        yield ["doc-1"]
+        yield ["doc-2"]
+
+    mock_retriever.aretrieve = _aretrieve
+    mock_retriever.chunk_cache_keys = {}
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+    llm.retriever = mock_retriever
+
+    async def _agenerate():
+        return await llm.agenerate("query", system_prompt="Per-call prompt.")
+
+    for call in (lambda: asyncio.run(_agenerate()), lambda: llm.generate_multi(["a", "b"], system_prompt="Per-call prompt.")):
+        with pytest.warns(DeprecationWarning) as record:
+            call()
+
+        assert len(record) == 1
+        assert record[0].filename == __file__
+
+def test_openai_llm_configure_lists_models_once(mocker, mock_clients):
+    """Test available models are listed on first configure and shared across instances."""
+
+    from HooRAGLib.Models import OpenAI as OpenAIModule
+
+    client, _ = mock_clients
+    mocker.patch.dict(OpenAIModule._MODELS_CACHE, clear=True)
+    model = mocker.Mock()
+    model.id = "gpt-4"
+    client.models.list.return_value = mocker.Mock(data=[model])
+
+    first = OpenAIModule.OpenAILLM(model_name="first", api_key="test-key")
+    second = OpenAIModule.OpenAILLM(model_name="second", api_key="test-key")
+
+    assert not client.models.list.called
+
+    first.configure(model_version="gpt-4")
+    second.configure(model_version="gpt-4")
+
+    assert client.models.list.call_count == 1
+    with pytest.raises(ValueError, match="is not available"):
+        second.configure(model_version="gpt-5")
+
+def test_openai_llm_configure_lists_models_per_base_url(mocker, mock_clients):
+    """Test the same API key used with different servers lists each server's models."""
+
+    from HooRAGLib.Models import OpenAI as OpenAIModule
+
+    mocker.patch.dict(OpenAIModule._MODELS_CACHE, clear=True)
+
+    def _client(api_key, base_url="https://api.openai.com/v1", **kwargs):
+        model = mocker.Mock()
+        model.id = "gpt-4" if "openai.com" in base_url else "llama-3"
+        client = mocker.Mock(base_url=base_url)
+        client.models.list.return_value = mocker.Mock(data=[model])
+        return client
+
+    OpenAIModule.OpenAI.side_effect = _client
+
+    openai = OpenAIModule.OpenAILLM(model_name="openai", api_key="EMPTY")
+    vllm = OpenAIModule.OpenAILLM(model_name="vllm", api_key="EMPTY", base_url="http://localhost:8000/v1")
+
+    openai.configure(model_version="gpt-4")
+    vllm.configure(model_version="llama-3")
+
+    assert len(OpenAIModule._MODELS_CACHE) == 2
+
+def test_openai_llm_stream_generate(mocker, mock_clients):
+    """Test streamed deltas are yielded in order and skip empty chunks."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, _ = mock_clients
+
+    def _chunk(content):
+        choice = mocker.Mock()
+        choice.delta.content = content
+        return mocker.Mock(choices=[choice])
+
+    client.chat.completions.create.side_effect = None
+    client.chat.completions.create.return_value = iter([_chunk("Hel"), _chunk(None), _chunk("lo"), mocker.Mock(choices=[])])
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+
+    assert "".join(llm.stream_generate("a", is_rag=False)) == "Hello"
+    assert client.chat.completions.create.call_args[1]['stream'] is True
+
+def test_openai_llm_astream_generate_retrieves_async(mocker, mock_clients, mock_retriever):
+    """Test async streaming retrieves through aretrieve and sends its final results."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    _, aclient = mock_clients
+
+    async def _aretrieve(query):
+        yield ["doc-1"]
+        yield ["doc-2"]
+
+    async def _stream():
+        choice = mocker.Mock()
+        choice.delta.content = "Hello"
+        yield mocker.Mock(choices=[choice])
+
+    mock_retriever.aretrieve = _aretrieve
+    mock_retriever.chunk_cache_keys = {}
+    aclient.chat.completions.create = mocker.AsyncMock(return_value=_stream())
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+    llm.retriever = mock_retriever
+
+    async def _collect():
+        return "".join([text async for text in llm.astream_generate("query")])
+
+    assert asyncio.run(_collect()) == "Hello"
+    assert not mock_retriever.retrieve.called
+    messages = aclient.chat.completions.create.call_args[1]['messages']
+    assert messages[1]['content'] == "<context>\ndoc-2\n</context>"
+
+@pytest.mark.parametrize("refinements, max_calls", [
+    ([["doc-1"], ["doc-1"]], 1),
+    ([["doc-1"], ["doc-2"]], 2),
+])
+def test_openai_llm_agenerate_speculative_retrieval(mocker, mock_clients, mock_retriever, refinements, max_calls):
+    """Test speculative generation is only reissued when the final retrieval differs."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    _, aclient = mock_clients
+
+    async def _aretrieve(query):
+        for refinement in refinements:
+            yield refinement
+
+    mock_retriever.aretrieve = _aretrieve
+    mock_retriever.chunk_cache_keys = {}
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+    llm.retriever = mock_retriever
+
+    asyncio.run(llm.agenerate("query"))
+
+    # A cancelled speculative request may not have been sent yet
+    assert 1 <= aclient.chat.completions.create.await_count <= max_calls
+    messages = aclient.chat.completions.create.call_args[1]['messages']
+    assert messages[1]['content'] == f"<context>\n{refinements[-1][0]}\n</context>"
+
+def test_openai_llm_generate_retries_rate_limit(mocker, mock_clients):
+    """Test rate limited requests are retried until they succeed."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, _ = mock_clients
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    error = RateLimitError("Rate limited.", response=httpx.Response(429, request=request), body=None)
+    response = client.chat.completions.create.side_effect(messages=[{"content": "a"}])
+    client.chat.completions.create.side_effect = [error, response]
+    mocker.patch('tenacity.nap.time.sleep')
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+
+    assert llm.generate("a", is_rag=False)['choices'] == ["a"]
+    assert client.chat.completions.create.call_count == 2
+
+def test_openai_llm_generate_batch_retries_polling(mocker, mock_clients):
+    """Test a rate limited batch status request is retried rather than losing the batch."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, _ = mock_clients
+    request = httpx.Request("GET", "https://api.openai.com/v1/batches/batch-1")
+    error = RateLimitError("Rate limited.", response=httpx.Response(429, request=request), body=None)
+    client.batches.create.return_value = mocker.Mock(id="batch-1", status="in_progress")
+    client.batches.retrieve.side_effect = [
+        error,
+        mocker.Mock(id="batch-1", status="completed", output_file_id=None, error_file_id=None)
+    ]
+    mocker.patch('tenacity.nap.time.sleep')
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+
+    responses = llm.generate_batch(["a"], poll_interval=0)
+
+    assert responses[0]['status'] is False
+    assert client.batches.retrieve.call_count == 2
+
+def test_openai_llm_shares_client(mocker, mock_clients):
+    """Test instances with the same API key and options share one client."""
+
+    from HooRAGLib.Models import OpenAI as OpenAIModule
+
+    first = OpenAIModule.OpenAILLM(model_name="first", api_key="test-key")
+    second = OpenAIModule.OpenAILLM(model_name="second", api_key="test-key")
+    third = OpenAIModule.OpenAILLM(model_name="third", api_key="test-key", base_url="http://localhost")
+    fourth = OpenAIModule.OpenAILLM(model_name="fourth", api_key="test-key", default_headers={"X-Test": "1"})
+
+    assert first.client is second.client
+    assert OpenAIModule.OpenAI.call_count == 3
+    assert len(OpenAIModule._CLIENT_REGISTRY) == 2
+
+def test_openai_llm_disables_sdk_retries(mocker, mock_clients):
+    """Test SDK retries are disabled by default, since the wrapper retries requests itself."""
+
+    from HooRAGLib.Models import OpenAI as OpenAIModule
+
+    OpenAIModule.OpenAILLM(model_name="first", api_key="test-key")
+    assert OpenAIModule.OpenAI.call_args[1]['max_retries'] == 0
+    assert OpenAIModule.AsyncOpenAI.call_args[1]['max_retries'] == 0
+
+    OpenAIModule.OpenAILLM(model_name="second", api_key="test-key", max_retries=2)
+    assert OpenAIModule.OpenAI.call_args[1]['max_retries'] == 2
+
+def test_openai_llm_generate_decodes_raw_response(mocker, mock_clients):
+    """Test raw chat completion bodies are decoded into the wrapper response."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, _ = mock_clients
+    client.chat.completions.create.side_effect = None
+    client.chat.completions.create.return_value = mocker.Mock(content=json.dumps({
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": "a"}, "finish_reason": "stop"},
+            {"index": 1, "message": {"role": "assistant", "content": None}, "finish_reason": "stop"}
+        ],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4}
+    }).encode("utf-8"))
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+
+    response = llm.generate("a", is_rag=False)
+
+    assert response['choices'] == ["a", None]
+    assert response['usage'].total_tokens == 4
+
+def test_openai_llm_generate_rag_without_retriever(mocker, mock_clients):
+    """Test RAG generation without a retriever raises ValueError before any request is sent."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, _ = mock_clients
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+
+    with pytest.raises(ValueError, match="Retriever is not set."):
+        llm.generate("a")
+
+    assert not client.chat.completions.create.called
+
+def test_openai_llm_embed_passes_client_to_retriever(mocker, mock_clients):
+    """Test retrievers receive the OpenAI clients unless they embed with the wrapper."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, aclient = mock_clients
+
+    class ClientRetriever(BaseRetriever):
+        def embed(self, client):
+            self.client = client
+            return {"data": []}
+
+        async def aembed(self, client):
+            self.aclient = client
+            return {"data": []}
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.retriever = ClientRetriever()
+    llm.embed()
+    asyncio.run(llm.aembed())
+
+    assert llm.retriever.client is client
+    assert llm.retriever.aclient is aclient
+
+    llm.retriever.embeds_with_wrapper = True
+    llm.embed()
+    asyncio.run(llm.aembed())
+
+    assert llm.retriever.client is llm
+    assert llm.retriever.aclient is llm
+
+def test_openai_llm_embed_texts_batches(mocker, mock_clients):
+    """Test texts are embedded in batches and stacked in input order."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, _ = mock_clients
+
+    def _create(model, input, encoding_format):
+        return mocker.Mock(data=[
+            mocker.Mock(index=i, embedding=base64.b64encode(np.array([float(text)], dtype=np.float32).tobytes()).decode())
+            for i, text in enumerate(input)
+        ])
+
+    client.embeddings.create.side_effect = _create
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    embeddings = llm.embed_texts([str(i) for i in range(5)], batch_size=2)
+
+    assert client.embeddings.create.call_count == 3
+    assert embeddings.dtype == np.float32
+    assert embeddings[:, 0].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    with pytest.raises(ValueError, match="Batch size must be between 1 and 2048."):
+        llm.embed_texts(["a"], batch_size=4096)
+
+def test_openai_llm_precompute_kv_unsupported_backend(mocker, mock_clients, mock_retriever):
+    """Test warmup falls back to a plain request when the backend rejects the cache key."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+    from HooRAGLib.Retrievers.BaseRetriever import BaseRetriever
+
+    client, _ = mock_clients
+    request = httpx.Request("POST", "http://localhost/v1/chat/completions")
+    error = BadRequestError(
+        "Unrecognized request argument supplied: prompt_cache_key", response=httpx.Response(400, request=request), body=None
+    )
+    client.chat.completions.create.side_effect = [error, None, None]
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.retriever = BaseRetriever()
+
+    with pytest.raises(ValueError, match="Model version is not set."):
+        llm.precompute_kv(["a"])
+    assert not client.chat.completions.create.called
+
+    llm.model_version = "gpt-4"
+    response = llm.precompute_kv(["a", "b"])
+
+    assert len(response['cache_keys']) == 2
+    assert client.chat.completions.create.call_count == 3
+    assert [call[1]['extra_body'] for call in client.chat.completions.create.call_args_list[1:]] == [{}, {}]
+
+def test_openai_llm_generate_without_prompt_cache_key(mocker, mock_clients):
+    """Test the prompt cache key can be disabled and is dropped after the backend rejects it."""
+
+    from HooRAGLib.Models.OpenAI import OpenAILLM
+
+    client, _ = mock_clients
+    disabled = OpenAILLM(model_name="test-model", api_key="test-key", prompt_cache_key=False)
+    disabled.model_version = "gpt-4"
+    disabled.generate("a", is_rag=False)
+
+    assert 'extra_body' not in client.chat.completions.create.call_args[1]
+
+    request = httpx.Request("POST", "http://localhost/v1/chat/completions")
+    error = BadRequestError(
+        "Unrecognized request argument supplied: prompt_cache_key", response=httpx.Response(400, request=request), body=None
+    )
+    completion = client.chat.completions.create.side_effect
+    client.chat.completions.create.side_effect = [error, completion(messages=[{"content": "b"}]), completion(messages=[{"content": "c"}])]
+
+    llm = OpenAILLM(model_name="test-model", api_key="test-key")
+    llm.model_version = "gpt-4"
+
+    assert llm.generate("b", is_rag=False)['choices'] == ["b"]
+    assert llm.generate("c", is_rag=False)['choices'] == ["c"]
+    assert client.chat.completions.create.call_count == 4
+    assert 'prompt_cache_key' not in client.chat.completions.create.call_args_list[2][1]['extra_body']
+    assert 'extra_body' not in client.chat.completions.create.call_args[1]
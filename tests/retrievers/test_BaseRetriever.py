@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+"""
+Test suite for the base retriever in HooRAGLib.
+
+:author: Hoo-dkwozD
+:version: 1.0.0
+:date: 2025-07-14
+"""
+
+# Python Standard Library imports
+
+# Third-party imports
+
+# Local imports
+from HooRAGLib.Retrievers.BaseRetriever import BaseRetriever
+
+
+def test_base_retriever_precompute_kv(mocker):
+    """Test each chunk is warmed up once and its cache key is recorded."""
+
+    warmup = mocker.Mock()
+    retriever = BaseRetriever()
+
+    keys = retriever.precompute_kv(warmup, "gpt-4", "System prompt.", ["a", "b"])
+
+    assert len(set(keys)) == 2
+    assert retriever.chunk_cache_keys == {"a": keys[0], "b": keys[1]}
+    assert BaseRetriever.chunk_cache_keys == {}
+    assert warmup.call_count == 2
+    assert warmup.call_args[0] == (
+        [{"role": "system", "content": "System prompt."}, {"role": "user", "content": "<context>\nb\n</context>"}],
+        keys[1]
+    )
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+"""
+Test suite for the dense retriever in HooRAGLib.
+
+:author: Hoo-dkwozD
+:version: 1.0.0
+:date: 2025-07-14
+"""
+
+# Python Standard Library imports
+import asyncio
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local imports
+from HooRAGLib.Helpers.Errors import EmbeddingError
+from HooRAGLib.Retrievers.DenseRetriever import DenseRetriever
+
+
+@pytest.fixture
+def mock_embedding_client(mocker):
+    """Fixture to mock an embedding client that embeds text by a lookup table."""
+
+    vectors = {
+        "cats": [1.0, 0.0, 0.0],
+        "dogs": [0.0, 1.0, 0.0],
+        "fish": [0.0, 0.0, 1.0],
+        "kittens": [0.9, 0.1, 0.0],
+    }
+
+    def _embed_texts(texts, model=None):
+        return np.array([vectors[text] for text in texts], dtype=np.float32)
+
+    client = mocker.Mock()
+    client.embed_texts.side_effect = _embed_texts
+    client.aembed_texts = mocker.AsyncMock(side_effect=_embed_texts)
+
+    return client
+
+def test_dense_retriever_retrieve(mock_embedding_client):
+    """Test documents are ranked by cosine similarity to the query."""
+
+    retriever = DenseRetriever(["fish", "dogs", "cats"])
+    response = retriever.embed(client=mock_embedding_client)
+
+    assert response['data'].dtype == np.float32
+    assert response['data'].shape == (3, 3)
+
+    assert retriever.has_embedding()
+    assert retriever.retrieve("kittens", top_k=2) == ["cats", "dogs"]
+    assert retriever.retrieve("kittens", top_k=10) == ["cats", "dogs", "fish"]
+
+def test_dense_retriever_aembed_uses_async_client(mock_embedding_client):
+    """Test async embedding goes through aembed_texts with the retriever's embedding model."""
+
+    retriever = DenseRetriever(["fish", "dogs", "cats"], embedding_model="text-embedding-3-large")
+    asyncio.run(retriever.aembed(client=mock_embedding_client))
+
+    mock_embedding_client.aembed_texts.assert_awaited_once_with(["fish", "dogs", "cats"], model="text-embedding-3-large")
+    mock_embedding_client.embed_texts.assert_not_called()
+
+    async def _aretrieve():
+        return [documents async for documents in retriever.aretrieve("kittens", top_k=1)]
+
+    assert asyncio.run(_aretrieve()) == [["cats"]]
+
+def test_dense_retriever_aretrieve_yields_final_result(mock_embedding_client):
+    """Test async retrieval over several tiles yields only the final top-k."""
+
+    retriever = DenseRetriever(["fish", "dogs", "cats"], tile_size=1)
+    retriever.embed(client=mock_embedding_client)
+
+    async def _aretrieve():
+        return [documents async for documents in retriever.aretrieve("kittens", top_k=1)]
+
+    assert asyncio.run(_aretrieve()) == [["cats"]]
+
+def test_dense_retriever_search_matches_brute_force():
+    """Test the top-k selection matches a full sort of the scores."""
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((100, 8)).astype(np.float32)
+    query = rng.standard_normal(8).astype(np.float32)
+
+    retriever = DenseRetriever([str(i) for i in range(100)])
+    retriever.index(embeddings)
+    indices, scores = retriever.search(query, top_k=5)
+
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    expected = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:5]
+    assert indices.tolist() == expected.tolist()
+    assert np.all(np.diff(scores) <= 0)
+
+def test_dense_retriever_retrieve_without_embeddings():
+    """Test retrieving before embedding raises EmbeddingError."""
+
+    with pytest.raises(EmbeddingError):
+        DenseRetriever(["cats"]).retrieve("cats")
+
+def test_dense_retriever_index_with_client(mock_embedding_client):
+    """Test precomputed embeddings can be queried once a client is given for queries."""
+
+    retriever = DenseRetriever(["fish", "dogs", "cats"])
+    retriever.index(np.eye(3, dtype=np.float32)[::-1])
+
+    with pytest.raises(EmbeddingError, match="No client to embed queries with."):
+        retriever.retrieve("kittens")
+
+    retriever.index(np.eye(3, dtype=np.float32)[::-1], client=mock_embedding_client)
+    assert retriever.retrieve("kittens", top_k=1) == ["cats"]
+
+def test_dense_retriever_no_documents(mock_embedding_client):
+    """Test embedding an empty document list raises ValueError."""
+
+    with pytest.raises(ValueError, match="There are no documents to index."):
+        DenseRetriever([]).embed(client=mock_embedding_client)
+
+def test_dense_retriever_invalid_backend():
+    """Test an unsupported backend raises ValueError."""
+
+    with pytest.raises(ValueError, match="Backend 'annoy' is not supported."):
+        DenseRetriever(["cats"], backend="annoy")
+
+def test_dense_retriever_quantized_search():
+    """Test int8 search returns the same ranking as float32 search."""
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((200, 16)).astype(np.float32)
+    query = embeddings[42] + 0.01 * rng.standard_normal(16).astype(np.float32)
+
+    exact = DenseRetriever([str(i) for i in range(200)])
+    exact.index(embeddings)
+    quantized = DenseRetriever([str(i) for i in range(200)], quantize=True)
+    quantized.index(embeddings)
+
+    exact_indices, exact_scores = exact.search(query, top_k=3)
+    quantized_indices, quantized_scores = quantized.search(query, top_k=3)
+
+    assert quantized._emb_i8.dtype == np.int8
+    assert quantized._embeddings is None
+    assert quantized_indices[0] == exact_indices[0] == 42
+    assert np.allclose(quantized_scores, exact_scores, atol=0.02)
+
+@pytest.mark.parametrize("quantize", [False, True])
+def test_dense_retriever_search_batch_tiled(quantize):
+    """Test tiled batch search matches untiled search for every query."""
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((250, 16)).astype(np.float32)
+    queries = rng.standard_normal((4, 16)).astype(np.float32)
+
+    tiled = DenseRetriever([str(i) for i in range(250)], quantize=quantize, tile_size=32)
+    tiled.index(embeddings)
+    untiled = DenseRetriever([str(i) for i in range(250)], quantize=quantize, tile_size=250)
+    untiled.index(embeddings)
+
+    indices, scores = tiled.search_batch(queries, top_k=7)
+
+    assert indices.shape == scores.shape == (4, 7)
+    for query, query_indices, query_scores in zip(queries, indices, scores):
+        expected_indices, expected_scores = untiled.search(query, top_k=7)
+        assert query_indices.tolist() == expected_indices.tolist()
+        assert np.allclose(query_scores, expected_scores)